@@ -0,0 +1,322 @@
+"""
+generate_corpus.py
+------------------
+Δημιουργεί συνθετικό CSV με το ίδιο schema με το dataset της Βουλής
+(member_name, political_party, sitting_date, speech), ώστε να μπορούμε να
+μετράμε την απόδοση χωρίς το πραγματικό CSV των ~2.3GB.
+
+Το λεξιλόγιο ακολουθεί κατανομή Zipf: περίπου οι μισές λέξεις προέρχονται από
+τα stopwords του data/stopwords-el.txt (όπως στην πραγματική γλώσσα) και οι
+υπόλοιπες από μια λίστα όρων κοινοβουλευτικού λόγου. Με το ίδιο seed παράγεται πάντα το ίδιο CSV.
+
+Με duplicate_rate > 0 ένα ποσοστό των ομιλιών αντικαθίσταται από σχεδόν ίδια
+αντίγραφα προηγούμενων ομιλιών (με λίγες αλλαγμένες λέξεις) και από σύντομες
+διαδικαστικές φράσεις, όπως στα πραγματικά πρακτικά. Οι υπόλοιπες ομιλίες
+μένουν ίδιες με αυτές χωρίς duplicate_rate.
+
+Χρήση (από τον φάκελο backend):
+    python -m benchmarks.generate_corpus --speeches 100000 --seed 42 [--duplicate-rate 0.1]
+"""
+
+import argparse
+import os
+import unicodedata
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STOPWORDS_PATH = os.path.join(BASE_DIR, "data", "stopwords-el.txt")
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, "data", "synthetic_speeches.csv")
+
+COLUMNS = ["member_name", "political_party", "sitting_date", "speech"]
+
+# -----------------------------------------------------------
+# 1. Λεξιλόγιο
+# -----------------------------------------------------------
+TERMS = [
+    "κυβέρνηση", "νομοσχέδιο", "τροπολογία", "βουλή", "υπουργός", "οικονομία",
+    "προϋπολογισμός", "φορολογία", "ανεργία", "εργαζόμενοι", "συντάξεις", "υγεία",
+    "παιδεία", "εκπαίδευση", "νοσοκομεία", "αγρότες", "τουρισμός", "επενδύσεις",
+    "ανάπτυξη", "μεταρρύθμιση", "διαφθορά", "διαφάνεια", "δημοκρατία", "σύνταγμα",
+    "ευρωπαϊκή", "ένωση", "μνημόνιο", "δανειστές", "χρέος", "ελλείμματα",
+    "πλεόνασμα", "τράπεζες", "αποκρατικοποιήσεις", "ιδιωτικοποίηση", "δημόσιο",
+    "υπάλληλοι", "αυτοδιοίκηση", "περιφέρεια", "δήμοι", "μεταναστευτικό",
+    "πρόσφυγες", "σύνορα", "άμυνα", "εξωτερική", "πολιτική", "τουρκία", "κύπρος",
+    "ασφάλεια", "αστυνομία", "δικαιοσύνη", "δικαστήρια", "ποινικός", "κώδικας",
+    "περιβάλλον", "ενέργεια", "ρεύμα", "λιγνίτης", "ανανεώσιμες", "κλιματική",
+    "αλλαγή", "μεταφορές", "λιμάνια", "αεροδρόμια", "σιδηρόδρομος", "οδικό",
+    "δίκτυο", "κοινωνική", "πρόνοια", "επίδομα", "οικογένεια", "νέοι", "φοιτητές",
+    "πανεπιστήμια", "έρευνα", "καινοτομία", "ψηφιακή", "διακυβέρνηση",
+    "γραφειοκρατία", "εξαγωγές", "εισαγωγές", "ναυτιλία", "εφοπλιστές",
+    "αλιεία", "κτηνοτροφία", "επιδοτήσεις", "αντιπολίτευση", "πλειοψηφία",
+    "ψηφοφορία", "άρθρο", "παράγραφος", "διάταξη", "επιτροπή", "ολομέλεια",
+    "συνεδρίαση", "πρόεδρος", "συνάδελφοι", "κύριε", "κυρία", "εισηγητής",
+    "ερώτηση", "επίκαιρη", "απάντηση", "ευθύνη", "σκάνδαλο", "εξεταστική",
+    "προανακριτική", "εκλογές", "εκλογικός", "νόμος", "ασφαλιστικό", "ταμεία",
+    "εισφορές", "μισθοί", "συλλογικές", "συμβάσεις", "αγορά", "εργασίας",
+    "ακρίβεια", "πληθωρισμός", "στέγαση", "ενοίκια", "πολιτισμός", "αθλητισμός",
+    "ολυμπιακοί", "αγώνες", "υποδομές", "έργα", "προγραμματισμός", "ταμείο",
+    "ανάκαμψης", "κονδύλια", "διαγωνισμός", "προμήθειες", "εξοπλιστικά",
+    "στρατός", "ναυτικό", "αεροπορία", "σεισμός", "πυρκαγιές", "πλημμύρες",
+    "πολιτική", "προστασία", "αποζημιώσεις", "νησιά", "ορεινές", "περιοχές",
+]
+
+FIRST_NAMES = [
+    "γεωργιος", "ιωαννης", "κωνσταντινος", "δημητριος", "νικολαος", "παναγιωτης",
+    "βασιλειος", "χρηστος", "αθανασιος", "μιχαηλ", "ευαγγελος", "σπυριδων",
+    "μαρια", "ελενη", "αικατερινη", "βασιλικη", "σοφια", "αναστασια", "ευαγγελια",
+    "γεωργια", "δεσποινα", "θεοδωρα", "αννα", "φωτεινη",
+]
+SURNAMES = [
+    "παπαδοπουλος", "παπαγεωργιου", "οικονομου", "γεωργιου", "νικολαου",
+    "δημητριου", "κωνσταντινου", "ιωαννου", "παππας", "μακρης", "καραγιαννης",
+    "βλαχος", "αντωνιου", "αθανασιου", "αλεξιου", "μαυρομματης", "κυριακου",
+    "σταυρου", "χριστοδουλου", "πετροπουλος", "αναγνωστου", "ζαχαριαδης",
+    "λαμπρακης", "τσακαλος", "μπακογιαννης", "ραλλης", "σαμαρας", "βενιζελος",
+]
+PARTIES = [
+    "πανελληνιο σοσιαλιστικο κινημα",
+    "νεα δημοκρατια",
+    "συνασπισμος ριζοσπαστικης αριστερας",
+    "κομμουνιστικο κομμα ελλαδας",
+    "συνασπισμος της αριστερας των κινηματων και της οικολογιας",
+    "λαικος ορθοδοξος συναγερμος",
+    "ανεξαρτητοι ελληνες",
+    "δημοκρατικη αριστερα",
+    "το ποταμι",
+    "ελληνικη λυση",
+    "ανεξαρτητος",
+]
+
+
+SYLLABLES = [
+    "κα", "πο", "λι", "τι", "κη", "νο", "μο", "σι", "ρα", "δη", "μα", "τα", "νε",
+    "στα", "θε", "ση", "προ", "γρα", "φη", "κρα", "τος", "λο", "γι", "ερ", "γα",
+    "συ", "ντα", "ξη", "νο", "μι", "κο", "ευ", "ρω", "πα", "ι", "κος", "ου", "αν",
+]
+ENDINGS = ["ς", "ση", "μος", "ων", "ες", "ια", "ικο", "ης", "ου"]
+STOPWORD_SHARE = 0.45  # Περίπου το ποσοστό των stopwords σε πραγματικό λόγο
+
+
+def load_stopwords(path: str = STOPWORDS_PATH) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def zipf_probabilities(n: int, exponent: float = 1.07) -> np.ndarray:
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    weights = ranks ** -exponent
+    return weights / weights.sum()
+
+
+def strip_accents(word: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", word) if not unicodedata.combining(c))
+
+
+def make_terms(rng: np.random.Generator, vocab_size: int, stopwords: set) -> list:
+    """
+    Οι πραγματικοί όροι (TERMS) καταλαμβάνουν τις πρώτες θέσεις και ακολουθεί
+    μακριά ουρά από ψευδολέξεις, ώστε το TF-IDF (max_features=5000) να βλέπει
+    λεξιλόγιο αντίστοιχου μεγέθους με το πραγματικό dataset.
+    Οι όροι γράφονται χωρίς τόνους, όπως τα ονόματα και τα stopwords του dataset,
+    ώστε να ταιριάζουν με το token_pattern [α-ω] των vectorizers.
+    """
+    terms = [t for t in dict.fromkeys(strip_accents(t) for t in TERMS) if t not in stopwords]
+    terms = [terms[i] for i in rng.permutation(len(terms))]
+    seen = set(terms) | stopwords
+    attempts = 0
+    while len(terms) < vocab_size and attempts < vocab_size * 20:
+        attempts += 1
+        n_syllables = rng.integers(2, 5)
+        word = "".join(SYLLABLES[i] for i in rng.integers(len(SYLLABLES), size=n_syllables))
+        word += ENDINGS[rng.integers(len(ENDINGS))]
+        if word not in seen:
+            seen.add(word)
+            terms.append(word)
+    return terms
+
+
+def build_vocabulary(rng: np.random.Generator, vocab_size: int):
+    """
+    Επιστρέφει (λέξεις, πιθανότητες). Stopwords και όροι έχουν η καθεμία
+    ομάδα δική της κατανομή Zipf, με σειρά κατάταξης που ορίζει το seed.
+    """
+    stopwords = load_stopwords()
+    terms = make_terms(rng, vocab_size, set(stopwords))
+    stopwords = [stopwords[i] for i in rng.permutation(len(stopwords))]
+    probabilities = np.concatenate([
+        STOPWORD_SHARE * zipf_probabilities(len(stopwords)),
+        (1 - STOPWORD_SHARE) * zipf_probabilities(len(terms)),
+    ])
+    return np.array(stopwords + terms, dtype=object), probabilities
+
+
+def noisy_variants(vocabulary: np.ndarray):
+    """
+    Παραλλαγές κάθε λέξης με θόρυβο που πρέπει να αφαιρέσει το clean_text
+    (σημεία στίξης, αριθμοί, κεφαλαία), μαζί με τις πιθανότητές τους.
+    """
+    variants = np.array([
+        vocabulary,
+        [w + "," for w in vocabulary],
+        [w + "." for w in vocabulary],
+        [w.upper() for w in vocabulary],
+        [w + " 2020" for w in vocabulary],
+    ], dtype=object)
+    return variants, np.array([0.84, 0.08, 0.05, 0.02, 0.01])
+
+
+# -----------------------------------------------------------
+# 2. Βουλευτές, κόμματα, ημερομηνίες
+# -----------------------------------------------------------
+def make_members(rng: np.random.Generator, n_members: int, n_parties: int) -> pd.DataFrame:
+    parties = PARTIES[:max(1, min(n_parties, len(PARTIES)))]
+    names = []
+    seen = set()
+    while len(names) < n_members:
+        surname = SURNAMES[rng.integers(len(SURNAMES))]
+        first = FIRST_NAMES[rng.integers(len(FIRST_NAMES))]
+        father = FIRST_NAMES[rng.integers(len(FIRST_NAMES))]
+        name = f"{surname} {first} {father}"
+        if name in seen:
+            # Ο χώρος ονομάτων είναι πεπερασμένος: προσθέτουμε αριθμό για μοναδικότητα
+            name = f"{name} {len(names)}"
+        seen.add(name)
+        names.append(name)
+    # Λίγα μεγάλα κόμματα και πολλά μικρά, όπως στην πραγματικότητα
+    party_idx = rng.choice(len(parties), size=n_members, p=zipf_probabilities(len(parties), 1.2))
+    return pd.DataFrame({"member_name": names, "political_party": [parties[i] for i in party_idx]})
+
+
+def make_dates(rng: np.random.Generator, n: int, start_year: int, end_year: int) -> list:
+    start = date(start_year, 1, 1)
+    span = (date(end_year, 12, 31) - start).days
+    offsets = np.sort(rng.integers(0, span + 1, size=n))
+    return [(start + timedelta(days=int(d))).strftime("%d/%m/%Y") for d in offsets]
+
+
+# -----------------------------------------------------------
+# 3. Ομιλίες
+# -----------------------------------------------------------
+def make_speeches(rng: np.random.Generator, variants: np.ndarray, variant_probabilities: np.ndarray,
+                  probabilities: np.ndarray, n: int, mean_words: int) -> list:
+    # Μήκη ομιλιών με lognormal κατανομή (πολλές σύντομες παρεμβάσεις, λίγες πολύ μεγάλες)
+    sigma = 1.0
+    mu = np.log(max(mean_words, 1)) - sigma ** 2 / 2
+    lengths = np.maximum(rng.lognormal(mu, sigma, size=n).astype(np.int64), 1)
+
+    # Όλες οι λέξεις του chunk σε μία vectorized κλήση, και μετά split ανά ομιλία
+    total = int(lengths.sum())
+    words = rng.choice(variants.shape[1], size=total, p=probabilities)
+    noise = rng.choice(variants.shape[0], size=total, p=variant_probabilities)
+    tokens = variants[noise, words]
+
+    bounds = np.cumsum(lengths)[:-1]
+    return [" ".join(chunk) for chunk in np.split(tokens, bounds)]
+
+
+PROCEDURAL_PHRASES = [
+    "Ευχαριστώ πολύ, κύριε Πρόεδρε.",
+    "Κύριε Πρόεδρε, ζητώ τον λόγο επί του Κανονισμού.",
+    "Καλούμε το Σώμα να ψηφίσει επί της αρχής του νομοσχεδίου.",
+    "Ο λόγος στον κύριο Υπουργό Οικονομικών για την τροπολογία.",
+    "Συνεχίζουμε με την ημερήσια διάταξη και τη συζήτηση του νομοσχεδίου.",
+    "Παρακαλώ, κυρίες και κύριοι συνάδελφοι, να τηρείτε τον χρόνο ομιλίας.",
+]
+# Μερίδιο των διπλότυπων που είναι διαδικαστικές φράσεις (τα υπόλοιπα είναι αντίγραφα)
+PROCEDURAL_SHARE = 0.3
+# Ποσοστό λέξεων που αλλάζουν σε κάθε αντίγραφο
+EDIT_RATE = 0.02
+# Από πόσες προηγούμενες ομιλίες επιλέγεται το πρωτότυπο ενός αντιγράφου
+HISTORY_SIZE = 5000
+
+
+def add_duplicates(rng: np.random.Generator, speeches: list, history: list, rate: float,
+                   vocabulary: np.ndarray) -> list:
+    """
+    Αντικαθιστά ποσοστό rate των ομιλίων με αντίγραφα προηγούμενων ομιλιών
+    (λίγες λέξεις αλλαγμένες) ή διαδικαστικές φράσεις. Το history κρατάει τις
+    πρόσφατες πρωτότυπες ομιλίες και ενημερώνεται επιτόπου.
+    """
+    speeches = list(speeches)
+    for i in np.flatnonzero(rng.random(len(speeches)) < rate):
+        if rng.random() < PROCEDURAL_SHARE:
+            speeches[i] = PROCEDURAL_PHRASES[rng.integers(len(PROCEDURAL_PHRASES))]
+            continue
+        earlier = len(history) + i
+        if not earlier:
+            continue
+        source = int(rng.integers(earlier))
+        words = (history[source] if source < len(history) else speeches[source - len(history)]).split()
+        n_edits = rng.binomial(len(words), EDIT_RATE)
+        for j in rng.choice(len(words), size=n_edits, replace=False):
+            words[j] = vocabulary[rng.integers(len(vocabulary))]
+        speeches[i] = " ".join(words)
+    history.extend(speeches)
+    del history[:-HISTORY_SIZE]
+    return speeches
+
+
+def generate(n_speeches: int, n_members: int = 300, n_parties: int = 8, start_year: int = 1989,
+             end_year: int = 2020, mean_words: int = 400, vocab_size: int = 20000, seed: int = 42,
+             chunksize: int = 20000, duplicate_rate: float = 0.0):
+    """Generator από DataFrame chunks με το schema του dataset."""
+    rng = np.random.default_rng(seed)
+    # Χωριστός generator για τα διπλότυπα, ώστε οι υπόλοιπες ομιλίες να μην αλλάζουν
+    duplicate_rng = np.random.default_rng([seed, 1])
+    history = []
+    vocabulary, probabilities = build_vocabulary(rng, vocab_size)
+    variants, variant_probabilities = noisy_variants(vocabulary)
+    members = make_members(rng, n_members, n_parties)
+    # Κάποιοι βουλευτές μιλάνε πολύ περισσότερο από άλλους
+    member_probabilities = zipf_probabilities(n_members, 0.8)
+    dates = make_dates(rng, n_speeches, start_year, end_year)
+
+    for start in range(0, n_speeches, chunksize):
+        n = min(chunksize, n_speeches - start)
+        speakers = members.iloc[rng.choice(n_members, size=n, p=member_probabilities)]
+        speeches = make_speeches(rng, variants, variant_probabilities, probabilities, n, mean_words)
+        if duplicate_rate > 0:
+            speeches = add_duplicates(duplicate_rng, speeches, history, duplicate_rate, vocabulary)
+        yield pd.DataFrame({
+            "member_name": speakers["member_name"].values,
+            "political_party": speakers["political_party"].values,
+            "sitting_date": dates[start:start + n],
+            "speech": speeches,
+        }, columns=COLUMNS)
+
+
+def write_csv(path: str, **kwargs) -> str:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    for i, chunk in enumerate(generate(**kwargs)):
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Συνθετικό corpus ομιλιών της Βουλής")
+    parser.add_argument("--speeches", type=int, default=10000)
+    parser.add_argument("--members", type=int, default=300)
+    parser.add_argument("--parties", type=int, default=8)
+    parser.add_argument("--start-year", type=int, default=1989)
+    parser.add_argument("--end-year", type=int, default=2020)
+    parser.add_argument("--mean-words", type=int, default=400)
+    parser.add_argument("--vocab-size", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0,
+                        help="Ποσοστό σχεδόν ίδιων ομιλιών και διαδικαστικών φράσεων")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    path = write_csv(
+        args.output, n_speeches=args.speeches, n_members=args.members, n_parties=args.parties,
+        start_year=args.start_year, end_year=args.end_year, mean_words=args.mean_words,
+        vocab_size=args.vocab_size, seed=args.seed, duplicate_rate=args.duplicate_rate,
+    )
+    print(f"✅ Δημιουργήθηκαν {args.speeches} συνθετικές ομιλίες στο {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+run_benchmarks.py
+-----------------
+Χρονομετρημένα benchmarks πάνω σε συνθετικό (ή πραγματικό) corpus:
+1. clean_text
+2. Στάδια TF-IDF, near-duplicate detection και ολόκληρο το keywords pipeline (με και χωρίς cache)
+3. Ομοιότητες βουλευτών (parliament.similarities)
+4. Endpoints του API (main.py) με stub Elasticsearch
+5. Cold start (import) του API και του CLI
+
+Τα αποτελέσματα γράφονται σε JSON ώστε να συγκρίνονται μεταξύ εκτελέσεων.
+
+Χρήση (από τον φάκελο backend):
+    python -m benchmarks.run_benchmarks --speeches 20000 --seed 42
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<παλιό>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig, ObjectApiResponse
+
+from benchmarks.generate_corpus import generate
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+
+# -----------------------------------------------------------
+# 1. Χρονομέτρηση
+# -----------------------------------------------------------
+def measure(func, repeat: int = 3, number: int = 1) -> dict:
+    """Εκτελεί τη func `repeat` φορές × `number` κλήσεις και επιστρέφει χρόνους ανά κλήση."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "repeat": repeat,
+        "number": number,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+
+@contextmanager
+def working_directory(path: str):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def environment_info(args) -> dict:
+    import numpy
+    import sklearn
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "numpy": numpy.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "corpus": {
+            "csv": args.csv,
+            "speeches": args.speeches,
+            "members": args.members,
+            "mean_words": args.mean_words,
+            "vocab_size": args.vocab_size,
+            "seed": args.seed,
+            "duplicate_rate": args.duplicate_rate,
+        },
+    }
+
+
+# -----------------------------------------------------------
+# 2. Corpus
+# -----------------------------------------------------------
+def load_corpus(args) -> pd.DataFrame:
+    if args.csv:
+        return pd.read_csv(args.csv, nrows=args.speeches)
+    chunks = generate(n_speeches=args.speeches, n_members=args.members,
+                      mean_words=args.mean_words, vocab_size=args.vocab_size, seed=args.seed)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def to_analysis_frame(raw: pd.DataFrame, clean_text) -> pd.DataFrame:
+    """Ίδια μορφή με το DataFrame που επιστρέφει το fetch_all_speeches()."""
+    dates = raw["sitting_date"].astype(str)
+    return pd.DataFrame({
+        "id": [f"syn-{i}" for i in range(len(raw))],
+        "member_name": raw["member_name"].astype(str).str.strip(),
+        "party": raw["political_party"].astype(str).str.strip(),
+        "date": dates,
+        "year": pd.to_datetime(dates, format="%d/%m/%Y", errors="coerce").dt.year,
+        "speech": [clean_text(s) for s in raw["speech"].astype(str)],
+    })
+
+
+# -----------------------------------------------------------
+# 3. Benchmarks
+# -----------------------------------------------------------
+def bench_analysis(raw: pd.DataFrame, repeat: int, results: dict, selected) -> pd.DataFrame:
+    from parliament import keywords as kw
+    from parliament.text import clean_text
+
+    speeches = raw["speech"].astype(str).tolist()
+    if selected("clean_text"):
+        results["clean_text"] = measure(lambda: [clean_text(s) for s in speeches], repeat)
+    df = to_analysis_frame(raw, clean_text)
+
+    stages = {
+        "tfidf_party": lambda: kw.compute_keywords(df, "party"),
+        "tfidf_member": lambda: kw.compute_keywords(df, "member_name"),
+        "tfidf_per_speech": lambda: kw.compute_keywords_per_speech(df),
+        "tfidf_yearly_party": lambda: kw.compute_keywords_over_time(df, group_col="year", related_col="party"),
+        "tfidf_yearly_member": lambda: kw.compute_keywords_over_time(df, group_col="year", related_col="member_name"),
+    }
+    for name, stage in stages.items():
+        if selected(name):
+            results[name] = measure(stage, repeat)
+    return df
+
+
+def bench_dedup(args, df: pd.DataFrame, repeat: int, results: dict):
+    """
+    MinHash LSH σε corpus με διπλότυπα (--duplicate-rate), ώστε να μετριούνται
+    και το lookup στο index, η επιβεβαίωση των υποψηφίων και το collapse.
+    Με --csv χρησιμοποιούνται οι πραγματικές ομιλίες.
+    """
+    from parliament.dedup import assign_clusters, collapse
+    from parliament.text import clean_text
+
+    if not args.csv and args.duplicate_rate > 0:
+        raw = pd.concat(generate(n_speeches=args.speeches, n_members=args.members, mean_words=args.mean_words,
+                                 vocab_size=args.vocab_size, seed=args.seed, duplicate_rate=args.duplicate_rate),
+                        ignore_index=True)
+        df = to_analysis_frame(raw, clean_text)
+    results["dedup"] = measure(lambda: collapse(assign_clusters(df)), repeat)
+    clustered = assign_clusters(df)
+    results["dedup"]["duplicates"] = int(len(df) - len(collapse(clustered)))
+
+
+def bench_pipeline(df: pd.DataFrame, workdir: str, repeat: int, workers, results: dict, selected):
+    """Όλο το keywords pipeline: πλήρης επανυπολογισμός και εκτέλεση με ενημερωμένη cache."""
+    from parliament.keywords import build_stages
+    from parliament.pipeline import Pipeline
+
+    pipeline = Pipeline(build_stages(), workers=workers)
+    with working_directory(workdir):
+        if selected("pipeline_keywords"):
+            results["pipeline_keywords"] = measure(lambda: pipeline.run({"speeches": df}, force=True), repeat)
+        if selected("pipeline_keywords_cached"):
+            pipeline.run({"speeches": df})
+            results["pipeline_keywords_cached"] = measure(lambda: pipeline.run({"speeches": df}), repeat)
+
+
+def bench_similarities(df: pd.DataFrame, repeat: int, results: dict):
+    from parliament.export import member_texts
+    from parliament.similarities import compute_similarities
+
+    texts = member_texts(df)
+    results["similarities"] = measure(lambda: compute_similarities(texts), repeat)
+
+
+def bench_cold_start(repeat: int, results: dict, selected):
+    """Χρόνος εκκίνησης νέου interpreter που κάνει import το API / το CLI."""
+    commands = {
+        "cold_start_api": [sys.executable, "-c", "import main"],
+        "cold_start_cli": [sys.executable, "-m", "parliament", "--help"],
+    }
+    for name, command in commands.items():
+        if selected(name):
+            results[name] = measure(lambda: subprocess.run(
+                command, cwd=BASE_DIR, check=True, stdout=subprocess.DEVNULL), repeat)
+
+
+class StubElasticsearch:
+    """
+    Επιστρέφει σελίδες από το συνθετικό corpus, με σταθερό `took`, ως
+    ObjectApiResponse όπως ο πραγματικός client.
+    """
+
+    def __init__(self, df: pd.DataFrame, took_ms: int = 5):
+        self.docs = df[["id", "member_name", "party", "date", "speech"]].to_dict("records")
+        self.took_ms = took_ms
+
+    def search(self, index=None, body=None, **kwargs):
+        body = body or {}
+        start = body.get("from", 0)
+        size = body.get("size", 10)
+        page = self.docs[start:start + size]
+        response = {
+            "took": self.took_ms,
+            "hits": {
+                "total": {"value": len(self.docs)},
+                "hits": [
+                    {"_id": d["id"], "_source": {k: d[k] for k in ("member_name", "party", "date", "speech")}}
+                    for d in page
+                ],
+            },
+        }
+        meta = ApiResponseMeta(status=200, http_version="1.1", headers=HttpHeaders(),
+                               duration=self.took_ms / 1000.0, node=NodeConfig("http", "localhost", 9200))
+        return ObjectApiResponse(body=response, meta=meta)
+
+
+def bench_api(df: pd.DataFrame, workdir: str, repeat: int, requests_per_sample: int, results: dict, selected):
+    from fastapi.testclient import TestClient
+
+    import main
+    from parliament import keywords as kw
+
+    pd.to_pickle(kw.compute_keywords_per_speech(df), os.path.join(workdir, "speech_keywords.pkl"))
+    pd.to_pickle(kw.compute_keywords_over_time(df, group_col="year", related_col="party"),
+                 os.path.join(workdir, "yearly_party_keywords.pkl"))
+    pd.to_pickle(kw.compute_keywords_over_time(df, group_col="year", related_col="member_name"),
+                 os.path.join(workdir, "yearly_member_keywords.pkl"))
+
+    party = df["party"].iloc[0]
+    member = df["member_name"].iloc[0]
+    speech_id = df["id"].iloc[len(df) // 2]
+    endpoints = {
+        "api_search": "/search?q=βουλή&size=10",
+        "api_search_page_100": "/search?q=βουλή&page=100&size=100",
+        "api_keywords_trends_party": f"/keywords/trends?entity_type=party&name={party}",
+        "api_keywords_trends_member": f"/keywords/trends?entity_type=member&name={member}",
+        "api_keywords_speech": f"/keywords/speech/{speech_id}",
+        "api_autocomplete": f"/autocomplete?entity_type=member&q={member[:3]}",
+    }
+
+    original_es = main.es
+    main.es = StubElasticsearch(df)
+    try:
+        with working_directory(workdir):
+            client = TestClient(main.app)
+            for name, url in endpoints.items():
+                if not selected(name):
+                    continue
+                # Το πρώτο request (ψυχρή cache) μετριέται χωριστά
+                start = time.perf_counter()
+                client.get(url).raise_for_status()
+                cold = time.perf_counter() - start
+                results[name] = measure(lambda: client.get(url), repeat, requests_per_sample)
+                results[name]["cold"] = cold
+    finally:
+        main.es = original_es
+
+
+# -----------------------------------------------------------
+# 4. Σύγκριση με προηγούμενη εκτέλεση
+# -----------------------------------------------------------
+def compare(current: dict, corpus: dict, baseline_path: str, threshold: float):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    baseline = data["results"]
+    print(f"\n📊 Σύγκριση με {baseline_path} (median):")
+    if data["environment"].get("corpus") != corpus:
+        print("⚠️ Το corpus διαφέρει από αυτό της σύγκρισης — οι χρόνοι δεν είναι άμεσα συγκρίσιμοι.")
+    regressions = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["median"], result["median"]
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = " ⚠️ regression"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = " 🚀"
+        print(f"{name:<28} {old * 1000:10.2f}ms → {new * 1000:10.2f}ms  ×{ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks του Greek Parliament IR backend")
+    parser.add_argument("--csv", help="CSV με το schema του dataset (αλλιώς παράγεται συνθετικό corpus)")
+    parser.add_argument("--speeches", type=int, default=20000)
+    parser.add_argument("--members", type=int, default=300)
+    parser.add_argument("--mean-words", type=int, default=400)
+    parser.add_argument("--vocab-size", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--duplicate-rate", type=float, default=0.1,
+                        help="Ποσοστό διπλότυπων στο corpus του benchmark dedup")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, help="Worker processes για το keywords pipeline")
+    parser.add_argument("--requests", type=int, default=50, help="Requests ανά δείγμα για τα API benchmarks")
+    parser.add_argument("--only", nargs="*", help="Εκτέλεση μόνο των benchmarks με αυτά τα προθέματα")
+    parser.add_argument("--output", help="Αρχείο JSON αποτελεσμάτων")
+    parser.add_argument("--compare", help="Προηγούμενο JSON για σύγκριση")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Ανοχή για regression (default 10%%)")
+    args = parser.parse_args()
+
+    def selected(name):
+        # Ταιριάζει και προς τις δύο κατευθύνσεις, ώστε π.χ. το "api_search" να ενεργοποιεί την ομάδα "api"
+        return not args.only or any(name.startswith(p) or p.startswith(name) for p in args.only)
+
+    print("🔹 Φόρτωση corpus...")
+    raw = load_corpus(args)
+    print(f"🔸 {len(raw)} ομιλίες")
+
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="greek-parliament-bench-")
+    try:
+        print("🧠 Benchmarks ανάλυσης keywords...")
+        df = bench_analysis(raw, args.repeat, results, selected)
+        if selected("dedup"):
+            print("🧬 Benchmark dedup...")
+            bench_dedup(args, df, args.repeat, results)
+        if selected("pipeline"):
+            print("🧩 Benchmarks keywords pipeline...")
+            bench_pipeline(df, workdir, args.repeat, args.workers, results, selected)
+        if selected("similarities"):
+            print("📈 Benchmark similarities...")
+            bench_similarities(df, args.repeat, results)
+        if selected("api"):
+            print("🌐 Benchmarks API...")
+            bench_api(df, workdir, args.repeat, args.requests, results, selected)
+        if selected("cold_start"):
+            print("🚀 Benchmarks cold start...")
+            bench_cold_start(args.repeat, results, selected)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n⏱️ Αποτελέσματα (ανά κλήση):")
+    for name, result in results.items():
+        print(f"{name:<28} median {result['median'] * 1000:10.2f}ms | min {result['min'] * 1000:10.2f}ms")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    environment = environment_info(args)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment, "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 Τα αποτελέσματα αποθηκεύτηκαν στο {output}")
+
+    if args.compare:
+        regressions = compare(results, environment["corpus"], args.compare, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
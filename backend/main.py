@@ -2,12 +2,16 @@ from fastapi import FastAPI, Query, HTTPException
 from elasticsearch import Elasticsearch
 from datetime import datetime
 from fastapi.middleware.cors import CORSMiddleware
-import pandas as pd
+from fastapi.responses import PlainTextResponse
 import os
+import time
+
+import metrics
+from parliament import artifacts
 
 es = Elasticsearch([{"host": "elasticsearch", "port": 9200, "scheme": "http"}], verify_certs=False, ssl_show_warn=False)
 
-app = FastAPI(title="Greek Parliament Search")
+app = FastAPI(title="Greek Parliament Search", default_response_class=metrics.InstrumentedJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,9 +20,34 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+metrics.install(app)
 
 INDEX_NAME = "greek_parliament_speeches"
 
+# Cache για τα pickle αρχεία: name -> (mtime, data).
+# Το αρχείο ξαναφορτώνεται μόνο αν αλλάξει το mtime (π.χ. νέο τρέξιμο του analyze_keywords.py).
+# Τα pickles είναι απλά dicts, οπότε φορτώνονται με το pickle χωρίς import του pandas.
+_pickle_cache = {}
+
+def load_pickle(name: str):
+    mtime = os.path.getmtime(artifacts.path(name))
+    cached = _pickle_cache.get(name)
+    if cached is not None and cached[0] == mtime:
+        metrics.CACHE_REQUESTS.inc(cache="pickle", result="hit")
+        return cached[1]
+    metrics.CACHE_REQUESTS.inc(cache="pickle", result="miss")
+    start = time.perf_counter()
+    data = artifacts.load(name)
+    metrics.PICKLE_LOAD.observe(time.perf_counter() - start, file=name)
+    _pickle_cache[name] = (mtime, data)
+    return data
+
+def es_search(**kwargs):
+    start = time.perf_counter()
+    res = es.search(**kwargs)
+    metrics.observe_es_call("search", res, time.perf_counter() - start)
+    return res
+
 def validate_date(date_str: str) -> str:
     try:
         datetime.strptime(date_str, "%d/%m/%Y")
@@ -26,7 +55,12 @@ def validate_date(date_str: str) -> str:
     except ValueError:
         raise HTTPException(status_code=400, detail="Οι ημερομηνίες πρέπει να είναι στη μορφή DD/MM/YYYY")
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(metrics.render_metrics(), media_type="text/plain; version=0.0.4")
+
 @app.get("/search")
+@metrics.instrumented
 def search(
     q: str = Query(None, description="Λέξη/φράση για αναζήτηση"),
     from_date: str = Query(None, description="Αρχική ημερομηνία (DD/MM/YYYY)"),
@@ -88,7 +122,7 @@ def search(
         "query": bool_query
     }
 
-    res = es.search(index=INDEX_NAME, body=query_body)
+    res = es_search(index=INDEX_NAME, body=query_body)
     total_hits = res["hits"]["total"]["value"]
     hits = [
     {
@@ -113,6 +147,7 @@ def search(
     }
 
 @app.get("/keywords/trends")
+@metrics.instrumented
 def get_keywords_trends(entity_type: str, name: str):
     """
     Επιστρέφει keywords ανά έτος για κόμμα ή βουλευτή.
@@ -120,17 +155,17 @@ def get_keywords_trends(entity_type: str, name: str):
     name: όνομα κόμματος ή βουλευτή
     """
     yearly_file = {
-        "party": "yearly_party_keywords.pkl",
-        "member": "yearly_member_keywords.pkl"
+        "party": artifacts.YEARLY_PARTY_KEYWORDS,
+        "member": artifacts.YEARLY_MEMBER_KEYWORDS
     }.get(entity_type)
 
-    if not yearly_file or not os.path.exists(yearly_file):
+    if not yearly_file or not artifacts.exists(yearly_file):
         return {
             "error": f"❗Το αρχείο {yearly_file} δεν βρέθηκε. "
                      f"Παρακαλώ εκτελέστε πρώτα το analyze_keywords.py."
         }
 
-    data = pd.read_pickle(yearly_file)
+    data = load_pickle(yearly_file)
 
     result = []
     for (year, entity), keywords in data.items():
@@ -146,10 +181,11 @@ def get_keywords_trends(entity_type: str, name: str):
     return sorted(result, key=lambda x: x["year"])
 
 @app.get("/keywords/speech/{speech_id}")
+@metrics.instrumented
 def get_speech_keywords(speech_id: str):
     speech_keywords = None
-    if os.path.exists("speech_keywords.pkl"):
-        speech_keywords = pd.read_pickle("speech_keywords.pkl")
+    if artifacts.exists(artifacts.SPEECH_KEYWORDS):
+        speech_keywords = load_pickle(artifacts.SPEECH_KEYWORDS)
     if speech_keywords is None:
         return {"error": "speech_keywords.pkl not found. Run analyze_keywords.py first."}
     if speech_id not in speech_keywords:
@@ -157,20 +193,21 @@ def get_speech_keywords(speech_id: str):
     return {"speech_id": speech_id, "keywords": speech_keywords[speech_id]}
 
 @app.get("/autocomplete")
+@metrics.instrumented
 def autocomplete(entity_type: str = Query(..., description="party ή member"),
                  q: str = Query(..., description="Το query string")):
     """
     Επιστρέφει λίστα από parties ή members που ταιριάζουν με το query.
     """
     yearly_file = {
-        "party": "yearly_party_keywords.pkl",
-        "member": "yearly_member_keywords.pkl"
+        "party": artifacts.YEARLY_PARTY_KEYWORDS,
+        "member": artifacts.YEARLY_MEMBER_KEYWORDS
     }.get(entity_type.lower())
 
-    if not yearly_file or not os.path.exists(yearly_file):
+    if not yearly_file or not artifacts.exists(yearly_file):
         return []
 
-    data = pd.read_pickle(yearly_file)
+    data = load_pickle(yearly_file)
 
     entities_set = {entity for (_, entity) in data.keys()}
 
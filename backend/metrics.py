@@ -0,0 +1,250 @@
+"""
+metrics.py
+----------
+Instrumentation για το FastAPI backend:
+1. Histograms latency ανά endpoint, ES `took` vs wall time, μέγεθος payload
+2. Counters για cache hits/misses
+3. Έξοδος σε μορφή Prometheus text (για το endpoint /metrics)
+4. Προαιρετικό profiling (cProfile) ανά request μέσω του header X-Profile
+"""
+
+import cProfile
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import defaultdict
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse, Response
+
+# -----------------------------------------------------------
+# 1. Βασικοί τύποι μετρικών
+# -----------------------------------------------------------
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = [(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in pairs]
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1.0, **labels):
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        with self._lock:
+            self._values[key] += amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [counts ανά bucket..., sum, count]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                for i, upper in enumerate(self.buckets):
+                    labels = _format_labels(self.labelnames, key, ("le", repr(float(upper))))
+                    lines.append(f"{self.name}_bucket{labels} {state[i]}")
+                labels = _format_labels(self.labelnames, key, ("le", "+Inf"))
+                lines.append(f"{self.name}_bucket{labels} {state[-1]}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {state[-2]}")
+                lines.append(f"{self.name}_count{labels} {state[-1]}")
+        return lines
+
+
+# -----------------------------------------------------------
+# 2. Μετρικές του API
+# -----------------------------------------------------------
+REQUEST_LATENCY = Histogram(
+    "api_request_duration_seconds", "Wall time ανά endpoint",
+    labelnames=("method", "endpoint", "status"),
+)
+RESPONSE_SIZE = Histogram(
+    "api_response_size_bytes", "Μέγεθος response body ανά endpoint",
+    labelnames=("endpoint",), buckets=SIZE_BUCKETS,
+)
+ES_TOOK = Histogram(
+    "es_took_seconds", "Χρόνος εκτέλεσης query όπως τον αναφέρει ο Elasticsearch (took)",
+    labelnames=("operation",),
+)
+ES_WALL = Histogram(
+    "es_wall_seconds", "Wall time της κλήσης προς τον Elasticsearch (took + δίκτυο + deserialization)",
+    labelnames=("operation",),
+)
+PICKLE_LOAD = Histogram(
+    "pickle_load_seconds", "Χρόνος φόρτωσης pickle αρχείων",
+    labelnames=("file",),
+)
+JSON_SERIALIZATION = Histogram(
+    "json_serialization_seconds", "Χρόνος JSON serialization των responses (jsonable_encoder + json.dumps)",
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Αναζητήσεις στην cache ανά αποτέλεσμα (hit/miss)",
+    labelnames=("cache", "result"),
+)
+
+REGISTRY = [REQUEST_LATENCY, RESPONSE_SIZE, ES_TOOK, ES_WALL, PICKLE_LOAD, JSON_SERIALIZATION, CACHE_REQUESTS]
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def observe_es_call(operation: str, response, wall_seconds: float):
+    ES_WALL.observe(wall_seconds, operation=operation)
+    # Ο client επιστρέφει ObjectApiResponse, που έχει __getitem__ αλλά όχι .get()
+    try:
+        took = response["took"]
+    except (KeyError, TypeError):
+        return
+    ES_TOOK.observe(took / 1000.0, operation=operation)
+
+
+class InstrumentedJSONResponse(JSONResponse):
+    """
+    JSONResponse που μετράει τον χρόνο serialization. Τα endpoints με τον
+    decorator instrumented επιστρέφουν το αποτέλεσμα χωρίς jsonable_encoder,
+    οπότε εδώ μετριέται και το encoding και το json.dumps.
+    """
+
+    def render(self, content) -> bytes:
+        start = time.perf_counter()
+        body = super().render(jsonable_encoder(content))
+        JSON_SERIALIZATION.observe(time.perf_counter() - start)
+        return body
+
+
+# -----------------------------------------------------------
+# 3. Profiling ανά request
+# -----------------------------------------------------------
+# Το profiling είναι απενεργοποιημένο εκτός αν οριστεί PROFILING_ENABLED=1.
+# Τότε ένα request με header "X-Profile: 1" εκτελείται κάτω από cProfile και,
+# αν διαρκέσει πάνω από PROFILE_SLOW_MS, το profile γράφεται στο PROFILE_DIR.
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "0") == "1"
+PROFILE_SLOW_MS = float(os.getenv("PROFILE_SLOW_MS", "500"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+PROFILE_HEADER = "x-profile"
+
+_profile_requested = contextvars.ContextVar("profile_requested", default=False)
+_profile_result = contextvars.ContextVar("profile_result", default=None)
+
+
+def _respond(func, *args, **kwargs):
+    result = func(*args, **kwargs)
+    if isinstance(result, Response):
+        return result
+    # Με έτοιμο Response το FastAPI δεν καλεί το δικό του jsonable_encoder,
+    # οπότε όλη η serialization γίνεται (και μετριέται) στο render
+    return InstrumentedJSONResponse(result)
+
+
+def instrumented(func):
+    """
+    Decorator για sync endpoints:
+    1. Επιστρέφει InstrumentedJSONResponse, ώστε το json_serialization_seconds
+       να περιλαμβάνει και το jsonable_encoder
+    2. Profiling όταν ζητηθεί. Τα sync endpoints εκτελούνται σε threadpool,
+       οπότε ο profiler πρέπει να ξεκινάει μέσα στο ίδιο thread με τη συνάρτηση.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _profile_requested.get():
+            return _respond(func, *args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(_respond, func, *args, **kwargs)
+        finally:
+            holder = _profile_result.get()
+            if holder is not None:
+                holder.append(profiler)
+    return wrapper
+
+
+def _dump_profile(profiler, endpoint: str, elapsed_ms: float) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    safe_name = endpoint.strip("/").replace("/", "_").replace("{", "").replace("}", "") or "root"
+    path = os.path.join(PROFILE_DIR, f"{safe_name}_{int(time.time() * 1000)}_{int(elapsed_ms)}ms.prof")
+    profiler.dump_stats(path)
+    return path
+
+
+# -----------------------------------------------------------
+# 4. Middleware
+# -----------------------------------------------------------
+def install(app):
+    """Προσθέτει το middleware των μετρικών στην εφαρμογή."""
+
+    @app.middleware("http")
+    async def metrics_middleware(request, call_next):
+        want_profile = PROFILING_ENABLED and request.headers.get(PROFILE_HEADER) == "1"
+        profiles = []
+        token_req = _profile_requested.set(want_profile)
+        token_res = _profile_result.set(profiles)
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+        finally:
+            elapsed = time.perf_counter() - start
+            _profile_requested.reset(token_req)
+            _profile_result.reset(token_res)
+            route = request.scope.get("route")
+            endpoint = getattr(route, "path", "unmatched")
+            REQUEST_LATENCY.observe(elapsed, method=request.method, endpoint=endpoint, status=str(status))
+
+        size = response.headers.get("content-length")
+        if size is not None:
+            RESPONSE_SIZE.observe(int(size), endpoint=endpoint)
+        response.headers["X-Response-Time-Ms"] = f"{elapsed * 1000:.1f}"
+
+        if profiles and elapsed * 1000 >= PROFILE_SLOW_MS:
+            path = _dump_profile(profiles[0], endpoint, elapsed * 1000)
+            response.headers["X-Profile-File"] = os.path.basename(path)
+        return response
+
+    return app
+
@@ -0,0 +1,10 @@
+"""
+parliament
+----------
+Batch pipeline του Greek Parliament IR project (ingestion, export,
+keywords, similarities). Τα modules φορτώνουν Elasticsearch, stopwords,
+pandas και sklearn μόνο όταν χρειαστούν, ώστε η εισαγωγή του πακέτου να
+είναι φθηνή (π.χ. για το API).
+
+Χρήση: python -m parliament {ingest,export,keywords,similarities}
+"""
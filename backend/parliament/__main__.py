@@ -0,0 +1,3 @@
+from parliament.cli import main
+
+main()
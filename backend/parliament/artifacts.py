@@ -0,0 +1,94 @@
+"""
+artifacts.py
+------------
+Ονόματα και φόρτωση/αποθήκευση των .pkl αποτελεσμάτων. Χρησιμοποιεί το
+pickle της stdlib, ώστε όποιος διαβάζει dicts (π.χ. το API) να μη φορτώνει
+το pandas. Όλες οι εγγραφές είναι atomic (temp αρχείο + rename).
+"""
+
+import glob
+import json
+import os
+import pickle
+import tempfile
+
+from parliament import config
+
+PARTY_KEYWORDS = "party_keywords.pkl"
+MEMBER_KEYWORDS = "member_keywords.pkl"
+SPEECH_KEYWORDS = "speech_keywords.pkl"
+YEARLY_PARTY_KEYWORDS = "yearly_party_keywords.pkl"
+YEARLY_MEMBER_KEYWORDS = "yearly_member_keywords.pkl"
+MEMBER_TEXTS = "member_texts.pkl"
+MEMBER_SIMILARITIES = "member_similarities.pkl"
+SPEECHES = "speeches.pkl"
+SPEECH_CLUSTERS = "speech_clusters.pkl"
+PIPELINE_MANIFEST = "pipeline_manifest.json"
+
+
+def path(name: str, directory=None) -> str:
+    return os.path.join(config.ARTIFACT_DIR if directory is None else directory, name)
+
+
+def exists(name: str) -> bool:
+    return os.path.exists(path(name))
+
+
+def load(name: str, directory=None):
+    with open(path(name, directory), "rb") as f:
+        return pickle.load(f)
+
+
+def atomic_write(target: str, write):
+    """
+    Γράφει σε προσωρινό αρχείο στον ίδιο φάκελο και μετά κάνει os.replace,
+    ώστε όποιος διαβάζει (π.χ. το API) να βλέπει είτε το παλιό είτε το νέο
+    αρχείο, ποτέ μισογραμμένο.
+    """
+    directory = os.path.dirname(os.path.abspath(target))
+    fd, tmp = tempfile.mkstemp(prefix=f".{os.path.basename(target)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # Το mkstemp δημιουργεί αρχείο με δικαιώματα 0600
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def remove_stale_temp(name: str) -> int:
+    """
+    Σβήνει προσωρινά αρχεία του atomic_write που έμειναν από διεργασία που
+    τερματίστηκε απότομα (π.χ. worker μετά από OOM kill). Επιστρέφει το πλήθος τους.
+    """
+    target = path(name)
+    pattern = os.path.join(os.path.dirname(os.path.abspath(target)), f".{glob.escape(os.path.basename(target))}.*.tmp")
+    removed = 0
+    for tmp in glob.glob(pattern):
+        try:
+            os.remove(tmp)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def save(obj, name: str):
+    atomic_write(path(name), lambda f: pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_json(name: str, default=None):
+    if not exists(name):
+        return default
+    with open(path(name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(obj, name: str):
+    data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    atomic_write(path(name), lambda f: f.write(data))
@@ -0,0 +1,99 @@
+"""
+cli.py
+------
+Ενιαίο CLI του pipeline:
+    python -m parliament ingest        → CSV → Elasticsearch
+    python -m parliament export        → Elasticsearch → speeches.pkl, member_texts.pkl
+    python -m parliament keywords      → TF-IDF keywords (.pkl), με cache και παράλληλα στάδια
+    python -m parliament dedup         → σχεδόν ίδιες ομιλίες (speech_clusters.pkl)
+    python -m parliament similarities  → ομοιότητες βουλευτών (.pkl)
+
+Κάθε υποεντολή εισάγει το module της μόνο όταν εκτελεστεί, ώστε π.χ. το
+ingest να μη φορτώνει το sklearn.
+"""
+
+import argparse
+
+from parliament import config
+from parliament.text import MAX_FEATURES
+
+
+def _ingest(args):
+    from parliament import ingest
+    ingest.run(csv_path=args.csv, index_name=args.index, chunksize=args.chunksize,
+               dedup=args.dedup, dedup_threshold=args.dedup_threshold)
+
+
+def _export(args):
+    from parliament import export
+    export.run(batch_size=args.batch_size)
+
+
+def _keywords(args):
+    from parliament import keywords
+    keywords.run(input_path=args.input, sample=args.sample, workers=args.workers, force=args.force,
+                 top_n=args.top_n, max_features=args.max_features,
+                 dedup=args.dedup, dedup_threshold=args.dedup_threshold)
+
+
+def _dedup(args):
+    from parliament import artifacts
+    from parliament.dedup import speech_clusters
+    from parliament.export import load_speeches
+
+    clusters = speech_clusters(load_speeches(args.input), threshold=args.dedup_threshold)
+    artifacts.save(clusters, artifacts.SPEECH_CLUSTERS)
+    print(f"\n💾 Αποθηκεύτηκαν τα clusters στο {artifacts.path(artifacts.SPEECH_CLUSTERS)}")
+
+
+def _similarities(args):
+    from parliament import similarities
+    similarities.run(use_lsi=not args.no_lsi, n_components=args.components, k=args.top_k)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m parliament",
+                                     description="Greek Parliament IR — batch pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("ingest", help="Φόρτωση του CSV στον Elasticsearch")
+    p.add_argument("--csv", default=config.CSV_PATH)
+    p.add_argument("--index", default=config.INDEX_NAME)
+    p.add_argument("--chunksize", type=int, default=5000)
+    p.add_argument("--dedup", choices=["tag", "collapse"],
+                   help="tag: πεδίο cluster_id σε κάθε ομιλία, collapse: ingestion μόνο μίας ομιλίας ανά cluster")
+    p.add_argument("--dedup-threshold", type=float, default=0.8)
+    p.set_defaults(func=_ingest)
+
+    p = subparsers.add_parser("export", help="Εξαγωγή καθαρισμένων ομιλιών από τον Elasticsearch σε .pkl")
+    p.add_argument("--batch-size", type=int, default=5000)
+    p.set_defaults(func=_export)
+
+    p = subparsers.add_parser("keywords", help="Υπολογισμός keywords (TF-IDF)")
+    p.add_argument("--input", help="speeches.pkl από το export (αλλιώς ανάκτηση από τον Elasticsearch)")
+    p.add_argument("--sample", type=int, help="Ανάλυση μόνο τυχαίου δείγματος N ομιλιών")
+    p.add_argument("--workers", type=int, help="Παράλληλα worker processes (default: έως ένα ανά στάδιο και CPU, όσα χωράνε στη μνήμη)")
+    p.add_argument("--force", action="store_true", help="Επανυπολογισμός όλων των σταδίων, αγνοώντας την cache")
+    p.add_argument("--top-n", type=int, default=10)
+    p.add_argument("--max-features", type=int, default=MAX_FEATURES)
+    p.add_argument("--dedup", action="store_true", help="Ανάλυση μόνο μίας ομιλίας ανά cluster σχεδόν ίδιων ομιλιών")
+    p.add_argument("--dedup-threshold", type=float, default=0.8)
+    p.set_defaults(func=_keywords)
+
+    p = subparsers.add_parser("dedup", help="Εντοπισμός σχεδόν ίδιων ομιλιών (MinHash LSH) και αναφορά")
+    p.add_argument("--input", help="speeches.pkl από το export (αλλιώς ανάκτηση από τον Elasticsearch)")
+    p.add_argument("--dedup-threshold", type=float, default=0.8)
+    p.set_defaults(func=_dedup)
+
+    p = subparsers.add_parser("similarities", help="Ομοιότητες μεταξύ βουλευτών")
+    p.add_argument("--no-lsi", action="store_true", help="Χωρίς LSI (TruncatedSVD)")
+    p.add_argument("--components", type=int, default=100)
+    p.add_argument("--top-k", type=int, default=10)
+    p.set_defaults(func=_similarities)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
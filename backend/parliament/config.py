@@ -0,0 +1,22 @@
+"""
+config.py
+---------
+Κοινές ρυθμίσεις (Elasticsearch, index, paths). Μόνο stdlib imports.
+"""
+
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+
+CSV_PATH = os.path.join(DATA_DIR, "Greek_Parliament_Proceedings_1989_2020.csv")
+STOPWORDS_PATH = os.path.join(DATA_DIR, "stopwords-el.txt")
+
+ES_HOST = os.getenv("ES_HOST", "localhost")
+ES_PORT = int(os.getenv("ES_PORT", "9200"))
+ES_REQUEST_TIMEOUT = int(os.getenv("ES_REQUEST_TIMEOUT", "300"))
+INDEX_NAME = "greek_parliament_speeches"
+
+# Τα .pkl γράφονται/διαβάζονται σχετικά με τον τρέχοντα φάκελο, όπως πάντα,
+# εκτός αν οριστεί ARTIFACT_DIR.
+ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "")
@@ -0,0 +1,246 @@
+"""
+dedup.py
+--------
+Εντοπισμός σχεδόν ίδιων ομιλιών (διαδικαστικές φράσεις, επαναλαμβανόμενα
+κείμενα) με MinHash + LSH πάνω στα shingles λέξεων του clean_text:
+1. Hashing των λέξεων και των shingles vectorized με numpy/pandas, ανά batch
+2. MinHash signatures με num_perm συναρτήσεις (a·x + b) mod (2^61 - 1)
+3. LSH σε bands: ομιλίες με ίδιο band είναι υποψήφιες και επιβεβαιώνονται
+   με την εκτιμώμενη ομοιότητα Jaccard των signatures
+4. Κάθε ομιλία παίρνει cluster_id = θέση της πρώτης ομιλίας του cluster
+
+Η επεξεργασία είναι streaming: η μνήμη ανά batch είναι φραγμένη από το
+max_shingles, και για κάθε μοναδική ομιλία κρατιέται μόνο η signature της
+(4·num_perm bytes) και ένα key ανά band (12 bytes).
+"""
+
+import numpy as np
+import pandas as pd
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+# Πολλαπλασιαστές για τον συνδυασμό hashes (σταθερές του splitmix64 / golden ratio)
+_MIX = np.array([0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB,
+                 0xD6E8FEB86659FD93, 0xA0761D6478BD642F, 0xE7037ED1A0B428DB,
+                 0x8EBC6AF09C88C6E3, 0x589965CC75374CC3], dtype=np.uint64)
+
+
+def optimal_bands(num_perm: int, threshold: float) -> tuple:
+    """(bands, rows) με bands·rows = num_perm και κατώφλι (1/b)^(1/r) κοντά στο threshold."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class Deduplicator:
+    def __init__(self, threshold=0.8, num_perm=64, shingle_size=3, seed=1, max_shingles=100_000):
+        if shingle_size > len(_MIX):
+            raise ValueError(f"Το shingle_size πρέπει να είναι έως {len(_MIX)}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_shingles = max_shingles
+        self.bands, self.rows = optimal_bands(num_perm, threshold)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)[:, None]
+
+        # LSH index ανά band: ταξινομημένα keys και slot του αντιπροσώπου
+        self._band_keys = [np.empty(0, dtype=np.uint64) for _ in range(self.bands)]
+        self._band_slots = [np.empty(0, dtype=np.int64) for _ in range(self.bands)]
+        # Signatures (uint32) και cluster ids των αντιπροσώπων, με διπλασιαζόμενη χωρητικότητα
+        self._signatures = np.empty((1024, num_perm), dtype=np.uint32)
+        self._slot_cluster = np.empty(1024, dtype=np.int64)
+        self._n_slots = 0
+
+        self.documents = 0
+        self.duplicates = 0
+        self.chars_total = 0
+        self.chars_duplicate = 0
+
+    # -----------------------------------------------------------
+    # MinHash
+    # -----------------------------------------------------------
+    def _shingles(self, texts):
+        """Επιστρέφει (hashes όλων των shingles, πλήθος shingles ανά κείμενο)."""
+        tokens = [t.split() for t in texts]
+        lengths = np.fromiter((len(t) for t in tokens), dtype=np.int64, count=len(tokens))
+        flat = np.fromiter((w for t in tokens for w in t), dtype=object, count=int(lengths.sum()))
+        token_hashes = pd.util.hash_array(flat) if len(flat) else np.empty(0, dtype=np.uint64)
+
+        k = self.shingle_size
+        # Κείμενα με λιγότερες από k λέξεις δίνουν ένα shingle με όσες λέξεις έχουν
+        counts = np.where(lengths >= k, lengths - k + 1, np.minimum(lengths, 1))
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        shingle_starts = np.repeat(starts, counts) + (
+            np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+        shingle_width = np.repeat(np.minimum(lengths, k), counts)
+
+        hashes = np.zeros(len(shingle_starts), dtype=np.uint64)
+        for offset in range(k):
+            present = shingle_width > offset
+            values = token_hashes[np.minimum(shingle_starts + offset, max(len(token_hashes) - 1, 0))]
+            hashes ^= np.where(present, values * _MIX[offset], np.uint64(0))
+        return hashes, counts
+
+    def signatures(self, texts) -> tuple:
+        """MinHash signatures (n, num_perm) και mask για κείμενα με τουλάχιστον ένα shingle."""
+        hashes, counts = self._shingles(texts)
+        n = len(counts)
+        result = np.full((n, self.num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+        has_shingles = counts > 0
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        # Τα κείμενα χωρίζονται σε ομάδες με έως max_shingles shingles, ώστε ο
+        # πίνακας num_perm × shingles να έχει φραγμένο μέγεθος.
+        doc = 0
+        while doc < n:
+            end = max(int(np.searchsorted(offsets, offsets[doc] + self.max_shingles, side="right")) - 1, doc + 1)
+            end = min(end, n)
+            idx = np.flatnonzero(has_shingles[doc:end]) + doc
+            if len(idx):
+                chunk = hashes[offsets[doc]:offsets[end]]
+                permuted = (self._a * chunk[None, :] + self._b) % MERSENNE_PRIME
+                result[idx] = np.minimum.reduceat(permuted, offsets[idx] - offsets[doc], axis=1).T
+            doc = end
+        return result, has_shingles
+
+    def _band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        n = signatures.shape[0]
+        banded = signatures.reshape(n, self.bands, self.rows)
+        mix = np.resize(_MIX, self.rows)
+        return (banded * mix).sum(axis=2, dtype=np.uint64)
+
+    # -----------------------------------------------------------
+    # LSH
+    # -----------------------------------------------------------
+    def _new_slot(self, signature: np.ndarray, cluster: int) -> int:
+        if self._n_slots == len(self._slot_cluster):
+            capacity = 2 * len(self._slot_cluster)
+            self._signatures = np.resize(self._signatures, (capacity, self.num_perm))
+            self._slot_cluster = np.resize(self._slot_cluster, capacity)
+        slot = self._n_slots
+        self._signatures[slot] = signature
+        self._slot_cluster[slot] = cluster
+        self._n_slots += 1
+        return slot
+
+    def add_batch(self, texts) -> np.ndarray:
+        """Προσθέτει ένα batch καθαρισμένων κειμένων και επιστρέφει τα cluster ids τους."""
+        texts = list(texts)
+        signatures, has_shingles = self.signatures(texts)
+        signatures32 = (signatures & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        band_hashes = self._band_hashes(signatures)
+
+        # Αναζήτηση στο index για όλο το batch μαζί
+        prior = np.full((len(texts), self.bands), -1, dtype=np.int64)
+        for j in range(self.bands):
+            keys = self._band_keys[j]
+            if not len(keys):
+                continue
+            pos = np.minimum(np.searchsorted(keys, band_hashes[:, j]), len(keys) - 1)
+            found = keys[pos] == band_hashes[:, j]
+            prior[found, j] = self._band_slots[j][pos[found]]
+
+        clusters = np.empty(len(texts), dtype=np.int64)
+        local = [{} for _ in range(self.bands)]
+        new_slots = []
+        for i, text in enumerate(texts):
+            position = self.documents + i
+            self.chars_total += len(text)
+            if not has_shingles[i]:
+                # Κενά κείμενα (μετά το clean_text) μένουν όπως είναι
+                clusters[i] = position
+                continue
+            candidates = []
+            for j in range(self.bands):
+                slot = prior[i, j]
+                if slot < 0:
+                    slot = local[j].get(band_hashes[i, j], -1)
+                if slot >= 0 and slot not in candidates:
+                    candidates.append(slot)
+            match = -1
+            for slot in candidates:
+                if np.mean(self._signatures[slot] == signatures32[i]) >= self.threshold:
+                    match = slot
+                    break
+            if match >= 0:
+                clusters[i] = self._slot_cluster[match]
+                self.duplicates += 1
+                self.chars_duplicate += len(text)
+            else:
+                slot = self._new_slot(signatures32[i], position)
+                clusters[i] = position
+                new_slots.append((i, slot))
+                for j in range(self.bands):
+                    local[j].setdefault(band_hashes[i, j], slot)
+
+        self._merge(band_hashes, new_slots)
+        self.documents += len(texts)
+        return clusters
+
+    def _merge(self, band_hashes: np.ndarray, new_slots: list):
+        if not new_slots:
+            return
+        rows = np.array([i for i, _ in new_slots])
+        slots = np.array([s for _, s in new_slots], dtype=np.int64)
+        for j in range(self.bands):
+            keys = band_hashes[rows, j]
+            # Κρατάμε μόνο τον πρώτο αντιπρόσωπο για κάθε key
+            keys, first = np.unique(keys, return_index=True)
+            existing = self._band_keys[j]
+            if len(existing):
+                pos = np.minimum(np.searchsorted(existing, keys), len(existing) - 1)
+                fresh = existing[pos] != keys
+                keys, first = keys[fresh], first[fresh]
+            insert_at = np.searchsorted(existing, keys)
+            self._band_keys[j] = np.insert(existing, insert_at, keys)
+            self._band_slots[j] = np.insert(self._band_slots[j], insert_at, slots[first])
+
+    # -----------------------------------------------------------
+    # Αναφορά
+    # -----------------------------------------------------------
+    def report(self):
+        if not self.documents:
+            return
+        share = self.duplicates / self.documents * 100
+        volume = self.chars_duplicate / self.chars_total * 100 if self.chars_total else 0.0
+        print(f"\n🧬 Near-duplicates (MinHash LSH, threshold={self.threshold}, "
+              f"{self.bands} bands × {self.rows} rows):")
+        print(f"   {self.duplicates}/{self.documents} ομιλίες ({share:.1f}%) είναι διπλότυπα")
+        print(f"   {self.chars_duplicate:,}/{self.chars_total:,} χαρακτήρες καθαρού κειμένου "
+              f"({volume:.1f}%) αφαιρούνται με collapse")
+
+
+def assign_clusters(df: pd.DataFrame, text_col="speech", batch_size=10000, **kwargs) -> pd.DataFrame:
+    """Επιστρέφει αντίγραφο του df με στήλη cluster_id (θέση της πρώτης ομιλίας του cluster)."""
+    dedup = Deduplicator(**kwargs)
+    texts = df[text_col].tolist()
+    clusters = np.concatenate([
+        dedup.add_batch(texts[start:start + batch_size])
+        for start in range(0, len(texts), batch_size)
+    ]) if texts else np.empty(0, dtype=np.int64)
+    dedup.report()
+    return df.assign(cluster_id=clusters)
+
+
+def collapse(df: pd.DataFrame) -> pd.DataFrame:
+    """Κρατάει μόνο την πρώτη ομιλία κάθε cluster."""
+    return df[df["cluster_id"].to_numpy() == np.arange(len(df))]
+
+
+def cluster_map(df: pd.DataFrame, id_col="id") -> pd.DataFrame:
+    """Αντιστοίχιση κάθε ομιλίας (id) στο id του αντιπροσώπου του cluster της."""
+    ids = df[id_col].to_numpy()
+    return pd.DataFrame({"id": ids, "representative_id": ids[df["cluster_id"].to_numpy()]})
+
+
+def speech_clusters(df: pd.DataFrame, threshold=0.8) -> pd.DataFrame:
+    """Στάδιο του pipeline / εντολή dedup: id → representative_id για όλες τις ομιλίες."""
+    return cluster_map(assign_clusters(df.reset_index(drop=True), threshold=threshold))
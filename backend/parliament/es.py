@@ -0,0 +1,24 @@
+"""
+es.py
+-----
+Lazy Elasticsearch client: δημιουργείται στην πρώτη κλήση του get_client().
+"""
+
+from parliament import config
+
+_client = None
+
+
+def get_client():
+    global _client
+    if _client is None:
+        from elasticsearch import Elasticsearch
+
+        _client = Elasticsearch(
+            [{"host": config.ES_HOST, "port": config.ES_PORT, "scheme": "http"}],
+            verify_certs=False,
+            ssl_show_warn=False,
+            request_timeout=config.ES_REQUEST_TIMEOUT
+        )
+    return _client
+
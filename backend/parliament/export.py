@@ -0,0 +1,86 @@
+"""
+export.py
+---------
+Ανάκτηση όλων των ομιλιών από τον Elasticsearch (scroll API), καθαρισμός
+του κειμένου και αποθήκευση σε .pkl, ώστε τα keywords/similarities να
+μπορούν να τρέξουν χωρίς νέο scroll.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+from parliament import artifacts, config
+from parliament.es import get_client
+from parliament.text import clean_text
+from parliament.timing import stage, report
+
+
+def fetch_all_speeches(batch_size=5000) -> pd.DataFrame:
+    es = get_client()
+    data = []
+    res = es.search(
+        index=config.INDEX_NAME,
+        body={"query": {"match_all": {}}},
+        scroll="5m",
+        size=batch_size
+    )
+    scroll_id = res["_scroll_id"]
+    total_hits = res["hits"]["total"]["value"]
+    print(f"Σύνολο ομιλιών προς ανάκτηση: {total_hits}")
+
+    fetched = 0
+    hits = res["hits"]["hits"]
+
+    while hits:
+        for hit in hits:
+            src = hit["_source"]
+            date = src.get("date", "")
+            try:
+                year = datetime.strptime(date, "%d/%m/%Y").year
+            except Exception:
+                year = None
+
+            data.append({
+                "id": hit["_id"],
+                "member_name": src.get("member_name", "").strip(),
+                "party": src.get("party", "").strip(),
+                "date": date,
+                "year": year,
+                "speech": clean_text(src.get("speech", "")),
+            })
+
+        fetched += len(hits)
+        print(f"✅ Ανακτήθηκαν {fetched}/{total_hits} ομιλίες")
+        res = es.scroll(scroll_id=scroll_id, scroll="5m")
+        scroll_id = res["_scroll_id"]
+        hits = res["hits"]["hits"]
+
+    return pd.DataFrame(data)
+
+
+def member_texts(df: pd.DataFrame) -> pd.Series:
+    """Όλες οι ομιλίες κάθε βουλευτή ενωμένες σε ένα κείμενο."""
+    return df.groupby("member_name")["speech"].apply(lambda x: " ".join(x))
+
+
+def load_speeches(path=None) -> pd.DataFrame:
+    """Ομιλίες από export (.pkl) αν δοθεί path, αλλιώς απευθείας από τον Elasticsearch."""
+    if path:
+        df = pd.read_pickle(path)
+        print(f"✅ Φορτώθηκαν {len(df)} ομιλίες από {path}")
+        return df
+    print("🔹 Ανάκτηση ομιλιών από τον Elasticsearch...")
+    return fetch_all_speeches()
+
+
+def run(batch_size=5000):
+    with stage("fetch_all_speeches"):
+        df = fetch_all_speeches(batch_size=batch_size)
+    with stage("save_pickles"):
+        artifacts.save(df, artifacts.SPEECHES)
+        artifacts.save(member_texts(df), artifacts.MEMBER_TEXTS)
+    print(f"\n📦 Αποθηκεύτηκαν {len(df)} ομιλίες σε {artifacts.path(artifacts.SPEECHES)} "
+          f"και {artifacts.path(artifacts.MEMBER_TEXTS)}")
+    report()
+    return df
@@ -0,0 +1,84 @@
+"""
+ingest.py
+---------
+Φόρτωση του CSV των πρακτικών στον Elasticsearch (bulk, σε chunks).
+"""
+
+import pandas as pd
+from elasticsearch import helpers
+
+from parliament import config
+from parliament.dedup import Deduplicator
+from parliament.es import get_client
+from parliament.text import clean_text
+from parliament.timing import stage, report
+
+# Δημιουργία νέου index με custom mapping
+MAPPING = {
+    "mappings": {
+        "properties": {
+            "member_name": {"type": "text"},
+            "party": {"type": "text"},
+            "date": {"type": "date", "format": "dd/MM/yyyy"},
+            "speech": {"type": "text"},
+            "cluster_id": {"type": "long"}
+        }
+    }
+}
+
+
+def generate_actions(df_chunk, index_name=config.INDEX_NAME, clusters=None, collapse=False):
+    for i, (_, row) in enumerate(df_chunk.iterrows()):
+        source = {
+            "member_name": str(row.get("member_name", "")),
+            "party": str(row.get("political_party", "")),
+            "date": str(row.get("sitting_date", "")),
+            "speech": str(row.get("speech", "")),
+        }
+        if clusters is not None:
+            cluster_id, position = int(clusters[i][0]), int(clusters[i][1])
+            if collapse and cluster_id != position:
+                continue
+            source["cluster_id"] = cluster_id
+        yield {
+            "_index": index_name,
+            "_source": source
+        }
+
+
+def create_index(es, index_name=config.INDEX_NAME):
+    # Διαγραφή υπάρχοντος index (αν υπάρχει) για καθαρό ingestion
+    if es.indices.exists(index=index_name):
+        print(f"🗑️ Deleting existing index '{index_name}'...")
+        es.indices.delete(index=index_name)
+
+    es.indices.create(index=index_name, body=MAPPING)
+    print("🆕 Created index with proper date mapping.")
+
+
+def run(csv_path=config.CSV_PATH, index_name=config.INDEX_NAME, chunksize=5000, dedup=None, dedup_threshold=0.8):
+    """
+    dedup: None → ingestion όπως είναι
+           "tag" → κάθε ομιλία παίρνει πεδίο cluster_id (MinHash LSH)
+           "collapse" → ingestion μόνο της πρώτης ομιλίας κάθε cluster
+    """
+    es = get_client()
+    print("🟢 Connected to Elasticsearch:", es.info()['version']['number'])
+
+    create_index(es, index_name)
+
+    deduplicator = Deduplicator(threshold=dedup_threshold) if dedup else None
+    with stage("bulk_ingest"):
+        for i, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunksize)):
+            print(f"📦 Processing chunk {i + 1}...")
+            clusters = None
+            if deduplicator is not None:
+                start = deduplicator.documents
+                ids = deduplicator.add_batch(clean_text(s) for s in chunk["speech"].astype(str))
+                clusters = list(zip(ids, range(start, start + len(ids))))
+            helpers.bulk(es, generate_actions(chunk, index_name, clusters, collapse=(dedup == "collapse")))
+            print(f"✅ Finished chunk {i + 1}")
+    print("🎉 Data ingestion completed!")
+    if deduplicator is not None:
+        deduplicator.report()
+    report()
@@ -0,0 +1,175 @@
+"""
+keywords.py
+-----------
+Αναλύει τα δεδομένα των ομιλιών της Βουλής:
+1. Keywords ανά ομιλία
+2. Keywords ανά βουλευτή
+3. Keywords ανά κόμμα
+4. Keywords ανά έτος (σχετικά με κόμμα & βουλευτή)
+"""
+
+import warnings
+from functools import partial
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from tqdm import tqdm
+
+from parliament import artifacts
+from parliament.dedup import speech_clusters
+from parliament.export import load_speeches, member_texts
+from parliament.pipeline import Pipeline, Stage, hash_values
+from parliament.text import MAX_FEATURES, TOKEN_PATTERN, get_stopwords
+from parliament.timing import stage, report
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn.feature_extraction.text")
+
+
+def make_vectorizer(max_features=MAX_FEATURES) -> TfidfVectorizer:
+    return TfidfVectorizer(
+        max_features=max_features,
+        stop_words=list(get_stopwords()),
+        token_pattern=TOKEN_PATTERN
+    )
+
+
+# -----------------------------------------------------------
+# 1. TF-IDF ανά ομάδα (κόμμα, βουλευτής)
+# -----------------------------------------------------------
+def compute_keywords(df: pd.DataFrame, group_col, top_n=10, max_features=MAX_FEATURES) -> dict:
+    results = {}
+    grouped = df.groupby(group_col)["speech"].apply(lambda x: " ".join(x))
+    vectorizer = make_vectorizer(max_features)
+
+    tfidf_matrix = vectorizer.fit_transform(grouped.values)
+    feature_names = vectorizer.get_feature_names_out()
+    for idx, name in enumerate(grouped.index):
+        scores = tfidf_matrix[idx].toarray()[0]
+        top_idx = scores.argsort()[-top_n:][::-1]
+        results[name] = [(feature_names[i], round(scores[i], 3)) for i in top_idx]
+    return results
+
+
+# -----------------------------------------------------------
+# 2. TF-IDF ανά ομιλία (batching)
+# -----------------------------------------------------------
+def compute_keywords_per_speech(df: pd.DataFrame, top_n=10, batch_size=5000, max_features=MAX_FEATURES) -> dict:
+    results = {}
+    vectorizer = make_vectorizer(max_features)
+
+    speeches = df["speech"].tolist()
+    indices = df["id"].tolist()
+    for start in tqdm(range(0, len(speeches), batch_size), desc="Υπολογισμός keywords ανά ομιλία"):
+        batch = [(i, s) for i, s in zip(indices[start:start+batch_size], speeches[start:start+batch_size]) if s.strip()]
+        if not batch:
+            continue
+        idxs, texts = zip(*batch)
+        tfidf_matrix = vectorizer.fit_transform(texts)
+        feature_names = vectorizer.get_feature_names_out()
+        for i, row in zip(idxs, tfidf_matrix.toarray()):
+            top_idx = row.argsort()[-top_n:][::-1]
+            results[i] = [(feature_names[j], round(row[j], 3)) for j in top_idx]
+    return results
+
+
+def compute_keywords_per_speech_dedup(df: pd.DataFrame, clusters: pd.DataFrame, top_n=10,
+                                      max_features=MAX_FEATURES) -> dict:
+    """
+    Keywords μόνο για τους αντιπροσώπους των clusters (έξοδος του speech_clusters).
+    Τα διπλότυπα παίρνουν τα keywords του αντιπροσώπου τους, ώστε το API να
+    βρίσκει όλα τα speech ids.
+    """
+    representatives = clusters.loc[clusters["id"] == clusters["representative_id"], "id"]
+    df = df[df["id"].isin(representatives)]
+    print(f"🔸 Keywords ανά ομιλία σε {len(df)} μοναδικές ομιλίες")
+    results = compute_keywords_per_speech(df, top_n=top_n, max_features=max_features)
+    for speech_id, representative_id in zip(clusters["id"], clusters["representative_id"]):
+        if speech_id != representative_id and representative_id in results:
+            results[speech_id] = results[representative_id]
+    return results
+
+
+# -----------------------------------------------------------
+# 3. TF-IDF ανά έτος + σχέση (κόμμα/βουλευτής)
+# -----------------------------------------------------------
+def compute_keywords_over_time(df: pd.DataFrame, group_col="year", related_col=None, top_n=10,
+                               max_features=MAX_FEATURES) -> dict:
+    results = {}
+    if related_col:
+        df = df.dropna(subset=[group_col, related_col])
+        grouped = df.groupby([group_col, related_col])["speech"].apply(lambda x: " ".join(x))
+    else:
+        df = df.dropna(subset=[group_col])
+        grouped = df.groupby(group_col)["speech"].apply(lambda x: " ".join(x))
+    vectorizer = make_vectorizer(max_features)
+
+    tfidf_matrix = vectorizer.fit_transform(grouped.values)
+    feature_names = vectorizer.get_feature_names_out()
+    for idx, name in enumerate(grouped.index):
+        scores = tfidf_matrix[idx].toarray()[0]
+        top_idx = scores.argsort()[-top_n:][::-1]
+        results[name] = [(feature_names[i], round(scores[i], 3)) for i in top_idx]
+    return results
+
+
+# -----------------------------------------------------------
+# 4. Στάδια του pipeline
+# -----------------------------------------------------------
+def build_stages(top_n=10, max_features=MAX_FEATURES, dedup=False, dedup_threshold=0.8) -> list:
+    params = {"top_n": top_n, "max_features": max_features}
+    fingerprint = {"stopwords": hash_values(get_stopwords())}
+    stages = []
+    if dedup:
+        # Μόνο τα keywords ανά ομιλία υπολογίζονται στις μοναδικές ομιλίες. Τα
+        # aggregates και το member_texts μένουν στο πλήρες corpus, ώστε να μην
+        # χάνονται ομιλίες που επαναλαμβάνουν ομιλία άλλου βουλευτή/κόμματος.
+        stages.append(Stage("speech_clusters", speech_clusters, artifacts.SPEECH_CLUSTERS,
+                            params={"threshold": dedup_threshold}))
+        speech_stage = Stage("speech_keywords", compute_keywords_per_speech_dedup, artifacts.SPEECH_KEYWORDS,
+                             inputs=("speeches", "speech_clusters"), params=params, fingerprint=fingerprint)
+    else:
+        speech_stage = Stage("speech_keywords", compute_keywords_per_speech,
+                             artifacts.SPEECH_KEYWORDS, params=params, fingerprint=fingerprint)
+    return stages + [
+        Stage("party_keywords", partial(compute_keywords, group_col="party"),
+              artifacts.PARTY_KEYWORDS, params=params, fingerprint=fingerprint),
+        Stage("member_keywords", partial(compute_keywords, group_col="member_name"),
+              artifacts.MEMBER_KEYWORDS, params=params, fingerprint=fingerprint),
+        speech_stage,
+        Stage("yearly_party_keywords", partial(compute_keywords_over_time, group_col="year", related_col="party"),
+              artifacts.YEARLY_PARTY_KEYWORDS, params=params, fingerprint=fingerprint),
+        Stage("yearly_member_keywords", partial(compute_keywords_over_time, group_col="year", related_col="member_name"),
+              artifacts.YEARLY_MEMBER_KEYWORDS, params=params, fingerprint=fingerprint),
+        Stage("member_texts", member_texts, artifacts.MEMBER_TEXTS),
+    ]
+
+
+# -----------------------------------------------------------
+# 5. Κύρια ροή
+# -----------------------------------------------------------
+def run(input_path=None, sample=None, workers=None, force=False, top_n=10, max_features=MAX_FEATURES,
+        dedup=False, dedup_threshold=0.8):
+    with stage("fetch_all_speeches"):
+        df = load_speeches(input_path)
+    if sample:
+        df = df.sample(n=min(sample, len(df)), random_state=42)
+        print(f"📊 Χρησιμοποιούνται {len(df)} ομιλίες για ανάλυση (δοκιμαστικό δείγμα).")
+
+    print(f"🔸 Ανακτήθηκαν {len(df)} ομιλίες")
+
+    if dedup:
+        print("🔸 Με --dedup αλλάζει μόνο το speech_keywords.pkl (τα keywords ανά κόμμα, "
+              "βουλευτή, έτος και το member_texts υπολογίζονται σε όλες τις ομιλίες)")
+
+    print("\n🧠 Υπολογισμός keywords (κόμμα, βουλευτής, ομιλία, έτος)...")
+    pipeline = Pipeline(build_stages(top_n=top_n, max_features=max_features, dedup=dedup,
+                                     dedup_threshold=dedup_threshold), workers=workers)
+    try:
+        # Τα στάδια του pipeline καταγράφονται ως υποστάδια, ώστε το σύνολο να είναι wall time
+        with stage("pipeline"):
+            pipeline.run({"speeches": df}, force=force)
+    finally:
+        report()
+
+    print("\n📦 Αποθηκεύτηκαν τα αποτελέσματα σε .pkl αρχεία")
+    print("✅ Ολοκληρώθηκε επιτυχώς!")
@@ -0,0 +1,307 @@
+"""
+pipeline.py
+-----------
+Μικρός pipeline runner για τα στάδια της ανάλυσης:
+1. Κάθε στάδιο δηλώνει τα inputs του (πηγές δεδομένων ή άλλα στάδια) και το .pkl που παράγει
+2. Το cache key είναι hash των δεδομένων εισόδου, των παραμέτρων και της έκδοσης του σταδίου
+3. Στάδια με ίδιο key και υπάρχον output παραλείπονται
+4. Ανεξάρτητα στάδια τρέχουν παράλληλα σε worker processes
+5. Τα outputs γράφονται atomically, οπότε μια αποτυχία δεν χαλάει τα προηγούμενα αποτελέσματα
+
+Τα keys αποθηκεύονται στο pipeline_manifest.json δίπλα στα .pkl.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from parliament import artifacts
+from parliament.timing import peak_rss_mb, record, reset_peak_rss
+
+
+class Stage:
+    """
+    func: συνάρτηση σε επίπεδο module (ώστε να γίνεται pickle για τους workers),
+          καλείται ως func(*inputs, **params)
+    inputs: ονόματα πηγών (π.χ. "speeches") ή άλλων σταδίων
+    params: keyword arguments της func, μέρος του cache key
+    fingerprint: επιπλέον τιμές που επηρεάζουν το αποτέλεσμα (π.χ. hash των stopwords)
+    version: αυξάνεται όταν αλλάζει η λογική του σταδίου, ώστε να ακυρώνεται η cache
+    """
+
+    def __init__(self, name, func, output, inputs=("speeches",), params=None, fingerprint=None, version=1):
+        self.name = name
+        self.func = func
+        self.output = output
+        self.inputs = tuple(inputs)
+        self.params = params or {}
+        self.fingerprint = fingerprint or {}
+        self.version = version
+
+
+class StageFailed(Exception):
+    pass
+
+
+def hash_frame(df) -> str:
+    """Content hash ενός DataFrame (vectorized μέσω του pandas)."""
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def hash_values(values) -> str:
+    digest = hashlib.sha256()
+    for value in sorted(values):
+        digest.update(str(value).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def stage_key(stage: Stage, input_keys: list) -> str:
+    payload = {
+        "stage": stage.name,
+        "version": stage.version,
+        "inputs": input_keys,
+        "params": stage.params,
+        "fingerprint": stage.fingerprint,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+# -----------------------------------------------------------
+# Worker
+# -----------------------------------------------------------
+_worker_stages = {}
+_worker_sources = {}
+
+
+def _init_worker(stages, sources):
+    # Με fork τα δεδομένα κληρονομούνται χωρίς pickle. Με spawn γίνονται
+    # pickle μία φορά ανά worker και όχι μία φορά ανά στάδιο.
+    _worker_stages.update(stages)
+    _worker_sources.update(sources)
+
+
+def _execute(stage: Stage, stages: dict, sources: dict):
+    start = time.perf_counter()
+    inputs = []
+    for name in stage.inputs:
+        if name in sources:
+            inputs.append(sources[name])
+        else:
+            inputs.append(artifacts.load(stages[name].output))
+    result = stage.func(*inputs, **stage.params)
+    artifacts.save(result, stage.output)
+    return time.perf_counter() - start, peak_rss_mb()
+
+
+def _run_in_worker(name: str):
+    # Οι workers ξαναχρησιμοποιούνται: το peak RSS πρέπει να αφορά μόνο αυτό το στάδιο
+    reset_peak_rss()
+    return _execute(_worker_stages[name], _worker_stages, _worker_sources)
+
+
+# -----------------------------------------------------------
+# Runner
+# -----------------------------------------------------------
+def _available_cpus() -> int:
+    # Σε container το sched_getaffinity σέβεται τα όρια CPU, το cpu_count όχι
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _available_memory():
+    """Διαθέσιμη μνήμη σε bytes (MemAvailable και όριο του cgroup), ή None αν δεν είναι γνωστή."""
+    available = None
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except OSError:
+        return None
+    try:
+        with open("/sys/fs/cgroup/memory.max", "r") as f:
+            limit = f.read().strip()
+        with open("/sys/fs/cgroup/memory.current", "r") as f:
+            current = int(f.read())
+        if limit != "max" and available is not None:
+            available = min(available, int(limit) - current)
+    except (OSError, ValueError):
+        pass
+    return available
+
+
+# Εκτίμηση μνήμης ανά worker ως πολλαπλάσιο του μεγέθους των δεδομένων εισόδου:
+# τα στάδια ενώνουν τις ομιλίες ανά ομάδα (ένα ακόμα αντίγραφο του κειμένου)
+# και φτιάχνουν τους πίνακες TF-IDF.
+WORKER_MEMORY_FACTOR = 3
+
+
+def default_workers(n_stages: int, sources: dict) -> int:
+    """
+    Πλήθος workers όταν δεν ορίζεται --workers: έως ένα ανά στάδιο και ανά CPU,
+    και όσα χωράνε στη διαθέσιμη μνήμη. Αν η μνήμη δεν είναι γνωστή, τα στάδια
+    εκτελούνται διαδοχικά.
+    """
+    available = _available_memory()
+    if available is None:
+        return 1
+    data_size = sum(int(df.memory_usage(deep=True).sum()) for df in sources.values())
+    by_memory = int(available // max(WORKER_MEMORY_FACTOR * data_size, 1))
+    return max(1, min(n_stages, _available_cpus(), by_memory))
+
+
+class Pipeline:
+    def __init__(self, stages, workers=None):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Τα ονόματα των σταδίων πρέπει να είναι μοναδικά")
+        # None: επιλογή στο run(), με βάση το μέγεθος των δεδομένων
+        self.workers = workers
+
+    def _order(self, sources: dict) -> list:
+        """Τοπολογική ταξινόμηση των σταδίων."""
+        ordered, seen = [], set()
+
+        def visit(name, path):
+            if name in seen:
+                return
+            if name in path:
+                raise ValueError(f"Κυκλική εξάρτηση στο στάδιο '{name}'")
+            for dep in self.stages[name].inputs:
+                if dep in self.stages:
+                    visit(dep, path | {name})
+                elif dep not in sources:
+                    raise ValueError(f"Άγνωστο input '{dep}' στο στάδιο '{name}'")
+            seen.add(name)
+            ordered.append(name)
+
+        for name in self.stages:
+            visit(name, frozenset())
+        return ordered
+
+    def _remove_stale_temp(self):
+        removed = sum(artifacts.remove_stale_temp(name) for name in
+                      [s.output for s in self.stages.values()] + [artifacts.PIPELINE_MANIFEST])
+        if removed:
+            print(f"🧹 Διαγράφηκαν {removed} προσωρινά αρχεία από διακοπείσα εκτέλεση")
+
+    def run(self, sources: dict, force=False) -> dict:
+        """
+        Εκτελεί τα στάδια που δεν είναι ενημερωμένα. Επιστρέφει dict
+        όνομα σταδίου → "cached" / "done" / "failed" / "skipped".
+        """
+        order = self._order(sources)
+        self._remove_stale_temp()
+        source_keys = {name: hash_frame(df) for name, df in sources.items()}
+        manifest = artifacts.load_json(artifacts.PIPELINE_MANIFEST, default={})
+
+        keys = {}
+        for name in order:
+            stage = self.stages[name]
+            input_keys = [source_keys[d] if d in sources else keys[d] for d in stage.inputs]
+            keys[name] = stage_key(stage, input_keys)
+
+        status = {}
+        pending = []
+        for name in order:
+            stage = self.stages[name]
+            if not force and manifest.get(stage.output) == keys[name] and artifacts.exists(stage.output):
+                status[name] = "cached"
+                print(f"♻️ [{name}] ενημερωμένο — παράλειψη")
+            else:
+                pending.append(name)
+
+        def ready(name):
+            return all(status.get(dep) in ("cached", "done") for dep in self.stages[name].inputs
+                       if dep in self.stages)
+
+        def blocked(name):
+            return any(status.get(dep) in ("failed", "skipped") for dep in self.stages[name].inputs
+                       if dep in self.stages)
+
+        def finish(name, elapsed, rss, worker=False):
+            status[name] = "done"
+            record(name, elapsed, rss, worker=worker)
+            # Το manifest ενημερώνεται μόνο από τη βασική διεργασία και μόνο μετά την επιτυχή εγγραφή
+            manifest[self.stages[name].output] = keys[name]
+            artifacts.save_json(manifest, artifacts.PIPELINE_MANIFEST)
+
+        def fail(name, error):
+            status[name] = "failed"
+            print(f"❌ [{name}] απέτυχε: {error!r}")
+
+        workers = self.workers
+        if workers is None:
+            workers = default_workers(len(pending), sources) if len(pending) > 1 else 1
+            if pending:
+                print(f"⚙️ {workers} worker(s) για {len(pending)} στάδια")
+
+        if workers <= 1 or len(pending) <= 1:
+            for name in pending:
+                if blocked(name):
+                    status[name] = "skipped"
+                    continue
+                try:
+                    finish(name, *_execute(self.stages[name], self.stages, sources))
+                except Exception as e:
+                    fail(name, e)
+        else:
+            broken = False
+            lost = []
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending)),
+                                     initializer=_init_worker, initargs=(self.stages, sources)) as pool:
+                running = {}
+                while (pending or running) and not broken:
+                    for name in list(pending):
+                        if blocked(name):
+                            status[name] = "skipped"
+                            pending.remove(name)
+                        elif ready(name):
+                            try:
+                                running[pool.submit(_run_in_worker, name)] = name
+                            except BrokenProcessPool:
+                                broken = True
+                                break
+                            pending.remove(name)
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        try:
+                            finish(name, *future.result(), worker=True)
+                        except BrokenProcessPool:
+                            broken = True
+                            lost.append(name)
+                        except Exception as e:
+                            fail(name, e)
+
+            if broken:
+                # Ένας worker τερματίστηκε απότομα (π.χ. OOM kill) και το pool δεν
+                # δέχεται άλλα στάδια. Όσα έτρεχαν ή περίμεναν σημειώνονται ως αποτυχημένα
+                # και σβήνονται τα μισογραμμένα προσωρινά αρχεία τους.
+                lost = [name for name in order if name in set(lost) | set(running.values()) | set(pending)]
+                for name in lost:
+                    status[name] = "failed"
+                print(f"💥 Ένας worker τερματίστηκε απότομα (π.χ. λόγω μνήμης) — δεν ολοκληρώθηκαν: "
+                      f"{', '.join(lost)}. Δοκιμάστε λιγότερους --workers.")
+                self._remove_stale_temp()
+
+        for name, state in status.items():
+            if state == "skipped":
+                print(f"⏭️ [{name}] παραλείφθηκε λόγω αποτυχίας σταδίου από το οποίο εξαρτάται")
+        failed = [name for name, state in status.items() if state in ("failed", "skipped")]
+        if failed:
+            raise StageFailed(f"Απέτυχαν τα στάδια: {', '.join(failed)}")
+        return status
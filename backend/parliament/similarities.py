@@ -0,0 +1,93 @@
+"""
+similarities.py
+---------------
+Computes similarities between parliament members based on their speeches
+using TF–IDF, optional LSI (Latent Semantic Indexing), and cosine similarity.
+"""
+
+import pandas as pd
+from sklearn.decomposition import TruncatedSVD
+from sklearn.metrics.pairwise import cosine_similarity
+
+from parliament import artifacts
+from parliament.export import fetch_all_speeches, member_texts as group_member_texts
+from parliament.keywords import make_vectorizer
+from parliament.timing import stage, report
+
+
+# -----------------------------------------------------------
+# 1. Load speech data (from pickle or directly from Elasticsearch)
+# -----------------------------------------------------------
+def load_member_texts() -> pd.Series:
+    if artifacts.exists(artifacts.MEMBER_TEXTS):
+        # Try loading previously saved speech data
+        member_texts = artifacts.load(artifacts.MEMBER_TEXTS)
+        print(f"✅ Loaded {len(member_texts)} members from pickle.")
+        return member_texts
+
+    print("⚠️ member_texts.pkl not found — fetching speeches from Elasticsearch...")
+    with stage("fetch_all_speeches"):
+        df = fetch_all_speeches()
+    print(f"📊 Retrieved {len(df)} speeches from Elasticsearch.")
+
+    # Combine all speeches per member into a single text
+    member_texts = group_member_texts(df)
+
+    # Save to pickle for future runs
+    artifacts.save(member_texts, artifacts.MEMBER_TEXTS)
+    print(f"✅ Created and saved member_texts.pkl with {len(member_texts)} members.")
+    return member_texts
+
+
+# -----------------------------------------------------------
+# 2. TF–IDF, optional LSI and cosine similarity
+# -----------------------------------------------------------
+def compute_similarities(member_texts: pd.Series, use_lsi=True, n_components=100, k=10) -> pd.DataFrame:
+    print("🧠 Creating TF–IDF representation...")
+    vectorizer = make_vectorizer()
+    with stage("tfidf"):
+        X = vectorizer.fit_transform(member_texts.values)
+
+    if use_lsi:
+        print("🔻 Applying LSI (TruncatedSVD) dimensionality reduction...")
+        svd = TruncatedSVD(n_components=n_components, random_state=42)
+        with stage("lsi"):
+            X = svd.fit_transform(X)
+    else:
+        X = X.toarray()
+
+    print("📈 Computing cosine similarity matrix...")
+    with stage("cosine_similarity"):
+        similarity_matrix = cosine_similarity(X)
+
+    # Find top-k most similar member pairs (upper triangular matrix only)
+    names = member_texts.index.tolist()
+    pairs = []
+    with stage("top_k_pairs"):
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                sim = similarity_matrix[i, j]
+                pairs.append((names[i], names[j], sim))
+
+        # Sort by similarity (highest first)
+        top_k_pairs = sorted(pairs, key=lambda x: x[2], reverse=True)[:k]
+
+    return pd.DataFrame(top_k_pairs, columns=["member_1", "member_2", "similarity"])
+
+
+# -----------------------------------------------------------
+# 3. Main flow
+# -----------------------------------------------------------
+def run(use_lsi=True, n_components=100, k=10) -> pd.DataFrame:
+    member_texts = load_member_texts()
+    top_k = compute_similarities(member_texts, use_lsi=use_lsi, n_components=n_components, k=k)
+
+    # Display top results
+    print(f"\n🏆 Top-{k} most similar pairs of members:")
+    for a, b, s in top_k.itertuples(index=False):
+        print(f"{a} — {b}: {s:.3f}")
+
+    artifacts.save(top_k, artifacts.MEMBER_SIMILARITIES)
+    print("\n💾 Results saved to member_similarities.pkl")
+    report()
+    return top_k
@@ -0,0 +1,45 @@
+"""
+text.py
+-------
+Stopwords και καθαρισμός κειμένου. Τα stopwords φορτώνονται από το αρχείο
+στην πρώτη χρήση και μετά κρατιούνται στη μνήμη.
+"""
+
+import functools
+import re
+import unicodedata
+
+from parliament import config
+
+# Κρατάμε μόνο ελληνικά γράμματα (πεζά και κεφαλαία, με ή χωρίς τόνους)
+_NON_GREEK = re.compile(r"[^Α-ΩΆΈΉΊΌΎΏΪΫα-ωάέήίόύώϊϋΐΰ\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Κοινές ρυθμίσεις των TfidfVectorizer (keywords και similarities)
+TOKEN_PATTERN = r"(?u)\b[α-ω]{3,}\b"
+MAX_FEATURES = 5000
+
+
+def load_stopwords(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_stopwords() -> frozenset:
+    return frozenset(load_stopwords(config.STOPWORDS_PATH))
+
+
+def clean_text(text: str) -> str:
+    stopwords = get_stopwords()
+    text = unicodedata.normalize("NFC", str(text))
+    text = _NON_GREEK.sub(" ", text)
+    text = _WHITESPACE.sub(" ", text)
+    # Μετατροπή σε πεζά ΜΕΤΑ τον καθαρισμό (ώστε να κρατηθούν οι τόνοι)
+    text = text.lower()
+    # Φιλτράρουμε λέξεις με μήκος > 2 και όχι στα stopwords
+    tokens = [
+        w for w in text.split()
+        if len(w) > 2 and w not in stopwords
+    ]
+    return " ".join(tokens)
@@ -0,0 +1,121 @@
+"""
+timing.py
+---------
+Χρονομέτρηση ανά στάδιο (stage) και αναφορά peak RSS για τις batch εντολές
+(ingest, export, keywords, similarities).
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_stages = []  # [name, elapsed, rss, depth]
+_depth = 0
+_worker_peak = None
+
+
+def _rusage_mb(who):
+    rss = resource.getrusage(who).ru_maxrss
+    # Σε macOS το ru_maxrss είναι σε bytes, σε Linux σε kilobytes
+    if sys.platform == "darwin":
+        return rss / (1024 * 1024)
+    return rss / 1024
+
+
+def peak_rss_mb():
+    """Μέγιστη μνήμη (RSS) της διεργασίας σε MB, ή None αν δεν είναι διαθέσιμη."""
+    # Σε Linux το VmHWM μηδενίζεται με reset_peak_rss(), το ru_maxrss όχι
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    return _rusage_mb(resource.RUSAGE_SELF)
+
+
+def children_peak_rss_mb():
+    """
+    Peak RSS του μεγαλύτερου worker, ή None αν δεν έτρεξαν workers. Το
+    RUSAGE_CHILDREN καλύπτει μόνο όσους έχουν τερματίσει και, μετά από
+    reset_peak_rss(), μόνο το τελευταίο στάδιό τους, οπότε συνδυάζεται με τα
+    peaks που κατέγραψαν οι ίδιοι οι workers.
+    """
+    if _worker_peak is None:
+        return None
+    if resource is None:
+        return _worker_peak
+    return max(_worker_peak, _rusage_mb(resource.RUSAGE_CHILDREN))
+
+
+def reset_peak_rss():
+    """
+    Μηδενίζει το peak RSS της διεργασίας (μόνο σε Linux). Οι workers του pipeline
+    ξαναχρησιμοποιούνται, οπότε χωρίς reset κάθε στάδιο θα έβλεπε το peak των
+    προηγούμενων.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _format_rss(rss):
+    return f"{rss:.0f} MB" if rss is not None else "n/a"
+
+
+@contextmanager
+def stage(name: str):
+    """Χρονομέτρηση σταδίου. Όσα στάδια καταγράφονται μέσα του εμφανίζονται ως υποστάδια."""
+    global _depth
+    entry = [name, 0.0, None, _depth]
+    _stages.append(entry)
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _depth -= 1
+        entry[1] = time.perf_counter() - start
+        entry[2] = peak_rss_mb()
+        print(f"⏱️ [{name}] {entry[1]:.2f}s — peak RSS: {_format_rss(entry[2])}")
+
+
+def record(name: str, elapsed: float, rss=None, worker=False):
+    """Καταγραφή σταδίου που χρονομετρήθηκε αλλού (π.χ. σε worker process)."""
+    global _worker_peak
+    if worker and rss is not None:
+        _worker_peak = max(rss, _worker_peak or 0)
+    _stages.append([name, elapsed, rss, _depth])
+    print(f"⏱️ [{name}] {elapsed:.2f}s — peak RSS: {_format_rss(rss)}")
+
+
+def report():
+    if not _stages:
+        return
+    # Μόνο τα στάδια πρώτου επιπέδου εκτελούνται διαδοχικά, οπότε το άθροισμά
+    # τους είναι wall time. Τα υποστάδια (π.χ. του pipeline) μπορεί να τρέχουν
+    # παράλληλα και δεν μετράνε στο σύνολο.
+    total = sum(elapsed for _, elapsed, _, depth in _stages if depth == 0)
+    width = max(len(name) + 2 * depth for name, _, _, depth in _stages)
+    print("\n⏱️ Χρόνοι ανά στάδιο:")
+    print("-" * (width + 34))
+    for name, elapsed, rss, depth in _stages:
+        label = "  " * depth + name
+        share = f"{elapsed / total * 100 if total else 0.0:5.1f}%" if depth == 0 else " " * 6
+        print(f"{label:<{width}} | {elapsed:9.2f}s | {share} | {_format_rss(rss)}")
+    print("-" * (width + 34))
+    rss = f"peak RSS: {_format_rss(peak_rss_mb())}"
+    children = children_peak_rss_mb()
+    if children is not None:
+        rss += f" (workers: έως {_format_rss(children)} ο καθένας)"
+    print(f"{'Σύνολο':<{width}} | {total:9.2f}s | {rss}")
@@ -1,12 +1,17 @@
-import os
+import functools
 import random
-import pandas as pd
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+from parliament import artifacts, config
 
-party_keywords = pd.read_pickle(os.path.join(BASE_DIR, "party_keywords.pkl"))
-member_keywords = pd.read_pickle(os.path.join(BASE_DIR, "member_keywords.pkl"))
-speech_keywords = pd.read_pickle(os.path.join(BASE_DIR, "speech_keywords.pkl"))
+# Όπως πριν, τα .pkl διαβάζονται από τον φάκελο του script, ανεξάρτητα από
+# τον τρέχοντα φάκελο, εκτός αν οριστεί ARTIFACT_DIR.
+ARTIFACT_DIR = config.ARTIFACT_DIR or config.BASE_DIR
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """Φορτώνει ένα .pkl μόνο όταν ζητηθεί για πρώτη φορά από το menu."""
+    return artifacts.load(name, directory=ARTIFACT_DIR)
 
 
 def show_list_options(options):
@@ -22,6 +27,7 @@ def show_list_options(options):
 
 
 def show_party_keywords():
+    party_keywords = load(artifacts.PARTY_KEYWORDS)
     print("\n📋 Διαθέσιμα κόμματα:")
     mapping = show_list_options(list(party_keywords.keys()))
     
@@ -39,6 +45,7 @@ def show_party_keywords():
 
 
 def show_member_keywords():
+    member_keywords = load(artifacts.MEMBER_KEYWORDS)
     print("\n📋 Διαθέσιμοι βουλευτές:")
     mapping = show_list_options(list(member_keywords.keys()))
     
@@ -56,6 +63,7 @@ def show_member_keywords():
 
 
 def show_speech_keywords():
+    speech_keywords = load(artifacts.SPEECH_KEYWORDS)
     while True:
         print("\n===================================")
         print("   📝 Keyword Analysis ανά ομιλία")